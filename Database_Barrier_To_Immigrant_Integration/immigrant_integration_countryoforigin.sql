@@ -28,6 +28,7 @@ CREATE TABLE `countryoforigin` (
   `region` varchar(100) DEFAULT NULL,
   `population_migrants` int DEFAULT NULL,
   `major_language` varchar(100) DEFAULT NULL,
+  `version` int NOT NULL DEFAULT '1',
   PRIMARY KEY (`country_id`)
 ) ENGINE=InnoDB AUTO_INCREMENT=21 DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_0900_ai_ci;
 /*!40101 SET character_set_client = @saved_cs_client */;
@@ -38,7 +39,7 @@ CREATE TABLE `countryoforigin` (
 
 LOCK TABLES `countryoforigin` WRITE;
 /*!40000 ALTER TABLE `countryoforigin` DISABLE KEYS */;
-INSERT INTO `countryoforigin` VALUES (1,'Mexico','North America',23000,'Spanish'),(2,'El Salvador','Central America',12000,'Spanish'),(3,'Honduras','Central America',11000,'Spanish'),(4,'Guatemala','Central America',9500,'Spanish'),(5,'Venezuela','South America',2100,'Spanish'),(6,'Colombia','South America',1500,'Spanish'),(7,'Cuba','Caribbean',800,'Spanish'),(8,'Haiti','Caribbean',300,'Haitian Creole'),(9,'Brazil','South America',600,'Portuguese'),(10,'India','Asia',600,'Hindi'),(11,'Nigeria','Africa',500,'English'),(12,'China','Asia',450,'Mandarin'),(13,'Somalia','Africa',200,'Somali'),(14,'Ethiopia','Africa',180,'Amharic'),(15,'Ukraine','Europe',100,'Ukrainian'),(16,'Dominican Republic','Caribbean',1100,'Spanish'),(17,'Philippines','Southeast Asia',210,'Filipino'),(18,'Vietnam','Southeast Asia',1400,'Vietnamese'),(19,'Afghanistan','South Asia',60,'Dari'),(20,'Russia','Eastern Europe',400,'Russian');
+INSERT INTO `countryoforigin` VALUES (1,'Mexico','North America',23000,'Spanish',1),(2,'El Salvador','Central America',12000,'Spanish',1),(3,'Honduras','Central America',11000,'Spanish',1),(4,'Guatemala','Central America',9500,'Spanish',1),(5,'Venezuela','South America',2100,'Spanish',1),(6,'Colombia','South America',1500,'Spanish',1),(7,'Cuba','Caribbean',800,'Spanish',1),(8,'Haiti','Caribbean',300,'Haitian Creole',1),(9,'Brazil','South America',600,'Portuguese',1),(10,'India','Asia',600,'Hindi',1),(11,'Nigeria','Africa',500,'English',1),(12,'China','Asia',450,'Mandarin',1),(13,'Somalia','Africa',200,'Somali',1),(14,'Ethiopia','Africa',180,'Amharic',1),(15,'Ukraine','Europe',100,'Ukrainian',1),(16,'Dominican Republic','Caribbean',1100,'Spanish',1),(17,'Philippines','Southeast Asia',210,'Filipino',1),(18,'Vietnam','Southeast Asia',1400,'Vietnamese',1),(19,'Afghanistan','South Asia',60,'Dari',1),(20,'Russia','Eastern Europe',400,'Russian',1);
 /*!40000 ALTER TABLE `countryoforigin` ENABLE KEYS */;
 UNLOCK TABLES;
 /*!40103 SET TIME_ZONE=@OLD_TIME_ZONE */;
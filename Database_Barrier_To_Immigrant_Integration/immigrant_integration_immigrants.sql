@@ -31,6 +31,7 @@ CREATE TABLE `immigrants` (
   `custody_id` int DEFAULT NULL,
   `legal_id` int DEFAULT NULL,
   `arrival_year` int DEFAULT NULL,
+  `version` int NOT NULL DEFAULT '1',
   PRIMARY KEY (`immigrant_id`),
   UNIQUE KEY `case_id` (`case_id`),
   KEY `fk_country` (`country_id`),
@@ -47,9 +48,63 @@ CREATE TABLE `immigrants` (
 
 LOCK TABLES `immigrants` WRITE;
 /*!40000 ALTER TABLE `immigrants` DISABLE KEYS */;
-INSERT INTO `immigrants` VALUES (1,'TX001',29,'Male',1,1,1,2015),(2,'TX002',34,'Female',2,2,2,2014),(3,'TX003',22,'Male',3,3,3,2016),(4,'TX004',40,'Female',4,4,4,2013),(5,'TX005',28,'Male',5,5,5,2015),(6,'TX006',37,'Female',6,6,6,2017),(7,'TX007',26,'Male',7,7,7,2016),(8,'TX008',33,'Female',8,8,8,2018),(9,'TX009',19,'Male',9,9,9,2018),(10,'TX010',42,'Female',10,10,10,2012),(11,'TX011',35,'Male',1,11,11,2015),(12,'TX012',27,'Female',2,12,12,2016),(13,'TX013',31,'Male',3,13,13,2017),(14,'TX014',24,'Female',4,14,14,2018),(15,'TX015',45,'Male',5,15,15,2014),(16,'TX016',30,'Female',6,16,16,2019),(17,'TX017',33,'Male',7,17,17,2018),(18,'TX018',21,'Female',8,18,18,2019),(19,'TX019',38,'Male',9,19,19,2017),(20,'TX020',41,'Female',10,20,20,2013),(21,'TX021',36,'Male',11,21,21,2014),(22,'TX022',25,'Female',12,22,22,2019),(23,'TX023',27,'Male',13,23,23,2015),(24,'TX024',32,'Female',14,24,24,2016),(25,'TX025',39,'Male',15,25,25,2017),(26,'TX026',23,'Female',1,26,26,2020),(27,'TX027',20,'Male',2,27,27,2019),(28,'TX028',44,'Female',3,28,28,2015),(29,'TX029',31,'Male',4,29,29,2018),(30,'TX030',29,'Female',5,30,30,2017),(31,'TX031',27,'Female',6,31,31,2019),(32,'TX032',34,'Male',2,32,32,2016),(33,'TX033',22,'Female',3,33,33,2018),(34,'TX034',39,'Male',4,34,34,2015),(35,'TX035',30,'Female',5,35,35,2017),(36,'TX036',25,'Male',8,36,36,2019),(37,'TX037',31,'Female',9,37,37,2016),(38,'TX038',40,'Male',10,38,38,2015),(39,'TX039',24,'Female',11,39,39,2019),(40,'TX040',45,'Male',12,40,40,2013),(41,'TX041',28,'Female',13,41,41,2018),(42,'TX042',33,'Male',14,42,42,2014),(43,'TX043',41,'Female',15,43,43,2013),(44,'TX044',29,'Male',1,44,44,2017),(45,'TX045',35,'Female',2,45,45,2016),(46,'TX046',38,'Male',3,46,46,2015),(47,'TX047',26,'Female',4,47,47,2020),(48,'TX048',32,'Male',5,48,48,2018),(49,'TX049',43,'Female',6,49,49,2013),(50,'TX050',37,'Male',7,50,50,2015),(51,'TX051',32,'Female',1,51,51,2012),(52,'TX052',28,'Male',2,52,52,2012),(53,'TX053',45,'Female',3,53,53,2012),(54,'TX054',36,'Male',4,54,54,2013),(55,'TX055',29,'Female',5,55,55,2013),(56,'TX056',41,'Male',6,56,56,2013),(57,'TX057',24,'Female',7,57,57,2013),(58,'TX058',38,'Male',8,58,58,2014),(59,'TX059',33,'Female',9,59,59,2014),(60,'TX060',27,'Male',10,60,60,2014),(61,'TX061',30,'Male',11,61,61,2014),(62,'TX062',26,'Female',12,62,62,2015),(63,'TX063',38,'Male',13,63,63,2015),(64,'TX064',29,'Female',14,64,64,2015),(65,'TX065',41,'Male',15,65,65,2015),(66,'TX066',33,'Female',16,66,66,2015),(67,'TX067',27,'Male',17,67,67,2016),(68,'TX068',35,'Female',18,68,68,2016),(69,'TX069',44,'Male',19,69,69,2016),(70,'TX070',31,'Female',20,70,70,2016),(71,'TX071',28,'Male',1,71,71,2016),(72,'TX072',36,'Female',2,72,72,2017),(73,'TX073',40,'Male',3,73,73,2017),(74,'TX074',25,'Female',4,74,74,2017),(75,'TX075',39,'Male',5,75,75,2017),(76,'TX076',32,'Female',6,76,76,2017),(77,'TX077',30,'Male',7,77,77,2018),(78,'TX078',24,'Female',8,78,78,2018),(79,'TX079',37,'Male',9,79,79,2018),(80,'TX080',29,'Female',10,80,80,2018),(81,'TX081',33,'Male',11,81,81,2018),(82,'TX082',27,'Female',12,82,82,2018),(83,'TX083',39,'Male',13,83,83,2019),(84,'TX084',24,'Female',14,84,84,2019),(85,'TX085',36,'Male',15,85,85,2019),(86,'TX086',30,'Female',16,86,86,2019),(87,'TX087',42,'Male',17,87,87,2020),(88,'TX088',25,'Female',18,88,88,2020),(89,'TX089',31,'Male',19,89,89,2020),(90,'TX090',38,'Female',20,90,90,2020),(91,'TX091',29,'Male',1,91,91,2020),(92,'TX092',33,'Female',2,92,92,2020),(93,'TX093',21,'Male',3,93,93,2020),(94,'TX094',44,'Female',4,94,94,2020),(95,'TX095',30,'Male',5,95,95,2020),(96,'TX096',26,'Female',6,96,96,2020),(97,'TX097',39,'Male',7,97,97,2020),(98,'TX098',23,'Female',8,98,98,2020),(99,'TX099',37,'Male',9,99,99,2020),(100,'TX100',29,'Female',10,100,100,2020),(101,'TX101',34,'Female',1,101,101,2012),(102,'TX102',29,'Male',2,102,102,2012),(103,'TX103',41,'Female',3,103,103,2012),(104,'TX104',36,'Male',4,104,104,2012),(105,'TX105',27,'Female',5,105,105,2013),(106,'TX106',39,'Male',6,106,106,2013),(107,'TX107',25,'Female',7,107,107,2013),(108,'TX108',33,'Male',8,108,108,2013),(109,'TX109',30,'Female',9,109,109,2013),(110,'TX110',28,'Male',10,110,110,2013),(111,'TX111',31,'Male',11,111,111,2014),(112,'TX112',26,'Female',12,112,112,2014),(113,'TX113',37,'Male',13,113,113,2014),(114,'TX114',29,'Female',14,114,114,2014),(115,'TX115',42,'Male',15,115,115,2014),(116,'TX116',35,'Female',16,116,116,2014),(117,'TX117',27,'Male',17,117,117,2015),(118,'TX118',32,'Female',18,118,118,2015),(119,'TX119',40,'Male',19,119,119,2015),(120,'TX120',31,'Female',20,120,120,2015),(121,'TX121',29,'Male',1,121,121,2016),(122,'TX122',34,'Female',2,122,122,2016),(123,'TX123',38,'Male',3,123,123,2016),(124,'TX124',26,'Female',4,124,124,2016),(125,'TX125',41,'Male',5,125,125,2017),(126,'TX126',33,'Female',6,126,126,2017),(127,'TX127',30,'Male',7,127,127,2017),(128,'TX128',24,'Female',8,128,128,2017),(129,'TX129',36,'Male',9,129,129,2018),(130,'TX130',28,'Female',10,130,130,2018),(131,'TX131',32,'Male',11,131,131,2018),(132,'TX132',27,'Female',12,132,132,2018),(133,'TX133',39,'Male',13,133,133,2019),(134,'TX134',25,'Female',14,134,134,2019),(135,'TX135',35,'Male',15,135,135,2019),(136,'TX136',31,'Female',16,136,136,2019),(137,'TX137',43,'Male',17,137,137,2020),(138,'TX138',26,'Female',18,138,138,2020),(139,'TX139',30,'Male',19,139,139,2020),(140,'TX140',37,'Female',20,140,140,2020),(141,'TX141',28,'Male',1,141,141,2020),(142,'TX142',34,'Female',2,142,142,2020),(143,'TX143',22,'Male',3,143,143,2020),(144,'TX144',45,'Female',4,144,144,2020),(145,'TX145',31,'Male',5,145,145,2020),(146,'TX146',27,'Female',6,146,146,2020),(147,'TX147',40,'Male',7,147,147,2020),(148,'TX148',24,'Female',8,148,148,2020),(149,'TX149',38,'Male',9,149,149,2020),(150,'TX150',30,'Female',10,150,150,2020);
+INSERT INTO `immigrants` VALUES (1,'TX001',29,'Male',1,1,1,2015,1),(2,'TX002',34,'Female',2,2,2,2014,1),(3,'TX003',22,'Male',3,3,3,2016,1),(4,'TX004',40,'Female',4,4,4,2013,1),(5,'TX005',28,'Male',5,5,5,2015,1),(6,'TX006',37,'Female',6,6,6,2017,1),(7,'TX007',26,'Male',7,7,7,2016,1),(8,'TX008',33,'Female',8,8,8,2018,1),(9,'TX009',19,'Male',9,9,9,2018,1),(10,'TX010',42,'Female',10,10,10,2012,1),(11,'TX011',35,'Male',1,11,11,2015,1),(12,'TX012',27,'Female',2,12,12,2016,1),(13,'TX013',31,'Male',3,13,13,2017,1),(14,'TX014',24,'Female',4,14,14,2018,1),(15,'TX015',45,'Male',5,15,15,2014,1),(16,'TX016',30,'Female',6,16,16,2019,1),(17,'TX017',33,'Male',7,17,17,2018,1),(18,'TX018',21,'Female',8,18,18,2019,1),(19,'TX019',38,'Male',9,19,19,2017,1),(20,'TX020',41,'Female',10,20,20,2013,1),(21,'TX021',36,'Male',11,21,21,2014,1),(22,'TX022',25,'Female',12,22,22,2019,1),(23,'TX023',27,'Male',13,23,23,2015,1),(24,'TX024',32,'Female',14,24,24,2016,1),(25,'TX025',39,'Male',15,25,25,2017,1),(26,'TX026',23,'Female',1,26,26,2020,1),(27,'TX027',20,'Male',2,27,27,2019,1),(28,'TX028',44,'Female',3,28,28,2015,1),(29,'TX029',31,'Male',4,29,29,2018,1),(30,'TX030',29,'Female',5,30,30,2017,1),(31,'TX031',27,'Female',6,31,31,2019,1),(32,'TX032',34,'Male',2,32,32,2016,1),(33,'TX033',22,'Female',3,33,33,2018,1),(34,'TX034',39,'Male',4,34,34,2015,1),(35,'TX035',30,'Female',5,35,35,2017,1),(36,'TX036',25,'Male',8,36,36,2019,1),(37,'TX037',31,'Female',9,37,37,2016,1),(38,'TX038',40,'Male',10,38,38,2015,1),(39,'TX039',24,'Female',11,39,39,2019,1),(40,'TX040',45,'Male',12,40,40,2013,1),(41,'TX041',28,'Female',13,41,41,2018,1),(42,'TX042',33,'Male',14,42,42,2014,1),(43,'TX043',41,'Female',15,43,43,2013,1),(44,'TX044',29,'Male',1,44,44,2017,1),(45,'TX045',35,'Female',2,45,45,2016,1),(46,'TX046',38,'Male',3,46,46,2015,1),(47,'TX047',26,'Female',4,47,47,2020,1),(48,'TX048',32,'Male',5,48,48,2018,1),(49,'TX049',43,'Female',6,49,49,2013,1),(50,'TX050',37,'Male',7,50,50,2015,1),(51,'TX051',32,'Female',1,51,51,2012,1),(52,'TX052',28,'Male',2,52,52,2012,1),(53,'TX053',45,'Female',3,53,53,2012,1),(54,'TX054',36,'Male',4,54,54,2013,1),(55,'TX055',29,'Female',5,55,55,2013,1),(56,'TX056',41,'Male',6,56,56,2013,1),(57,'TX057',24,'Female',7,57,57,2013,1),(58,'TX058',38,'Male',8,58,58,2014,1),(59,'TX059',33,'Female',9,59,59,2014,1),(60,'TX060',27,'Male',10,60,60,2014,1),(61,'TX061',30,'Male',11,61,61,2014,1),(62,'TX062',26,'Female',12,62,62,2015,1),(63,'TX063',38,'Male',13,63,63,2015,1),(64,'TX064',29,'Female',14,64,64,2015,1),(65,'TX065',41,'Male',15,65,65,2015,1),(66,'TX066',33,'Female',16,66,66,2015,1),(67,'TX067',27,'Male',17,67,67,2016,1),(68,'TX068',35,'Female',18,68,68,2016,1),(69,'TX069',44,'Male',19,69,69,2016,1),(70,'TX070',31,'Female',20,70,70,2016,1),(71,'TX071',28,'Male',1,71,71,2016,1),(72,'TX072',36,'Female',2,72,72,2017,1),(73,'TX073',40,'Male',3,73,73,2017,1),(74,'TX074',25,'Female',4,74,74,2017,1),(75,'TX075',39,'Male',5,75,75,2017,1),(76,'TX076',32,'Female',6,76,76,2017,1),(77,'TX077',30,'Male',7,77,77,2018,1),(78,'TX078',24,'Female',8,78,78,2018,1),(79,'TX079',37,'Male',9,79,79,2018,1),(80,'TX080',29,'Female',10,80,80,2018,1),(81,'TX081',33,'Male',11,81,81,2018,1),(82,'TX082',27,'Female',12,82,82,2018,1),(83,'TX083',39,'Male',13,83,83,2019,1),(84,'TX084',24,'Female',14,84,84,2019,1),(85,'TX085',36,'Male',15,85,85,2019,1),(86,'TX086',30,'Female',16,86,86,2019,1),(87,'TX087',42,'Male',17,87,87,2020,1),(88,'TX088',25,'Female',18,88,88,2020,1),(89,'TX089',31,'Male',19,89,89,2020,1),(90,'TX090',38,'Female',20,90,90,2020,1),(91,'TX091',29,'Male',1,91,91,2020,1),(92,'TX092',33,'Female',2,92,92,2020,1),(93,'TX093',21,'Male',3,93,93,2020,1),(94,'TX094',44,'Female',4,94,94,2020,1),(95,'TX095',30,'Male',5,95,95,2020,1),(96,'TX096',26,'Female',6,96,96,2020,1),(97,'TX097',39,'Male',7,97,97,2020,1),(98,'TX098',23,'Female',8,98,98,2020,1),(99,'TX099',37,'Male',9,99,99,2020,1),(100,'TX100',29,'Female',10,100,100,2020,1),(101,'TX101',34,'Female',1,101,101,2012,1),(102,'TX102',29,'Male',2,102,102,2012,1),(103,'TX103',41,'Female',3,103,103,2012,1),(104,'TX104',36,'Male',4,104,104,2012,1),(105,'TX105',27,'Female',5,105,105,2013,1),(106,'TX106',39,'Male',6,106,106,2013,1),(107,'TX107',25,'Female',7,107,107,2013,1),(108,'TX108',33,'Male',8,108,108,2013,1),(109,'TX109',30,'Female',9,109,109,2013,1),(110,'TX110',28,'Male',10,110,110,2013,1),(111,'TX111',31,'Male',11,111,111,2014,1),(112,'TX112',26,'Female',12,112,112,2014,1),(113,'TX113',37,'Male',13,113,113,2014,1),(114,'TX114',29,'Female',14,114,114,2014,1),(115,'TX115',42,'Male',15,115,115,2014,1),(116,'TX116',35,'Female',16,116,116,2014,1),(117,'TX117',27,'Male',17,117,117,2015,1),(118,'TX118',32,'Female',18,118,118,2015,1),(119,'TX119',40,'Male',19,119,119,2015,1),(120,'TX120',31,'Female',20,120,120,2015,1),(121,'TX121',29,'Male',1,121,121,2016,1),(122,'TX122',34,'Female',2,122,122,2016,1),(123,'TX123',38,'Male',3,123,123,2016,1),(124,'TX124',26,'Female',4,124,124,2016,1),(125,'TX125',41,'Male',5,125,125,2017,1),(126,'TX126',33,'Female',6,126,126,2017,1),(127,'TX127',30,'Male',7,127,127,2017,1),(128,'TX128',24,'Female',8,128,128,2017,1),(129,'TX129',36,'Male',9,129,129,2018,1),(130,'TX130',28,'Female',10,130,130,2018,1),(131,'TX131',32,'Male',11,131,131,2018,1),(132,'TX132',27,'Female',12,132,132,2018,1),(133,'TX133',39,'Male',13,133,133,2019,1),(134,'TX134',25,'Female',14,134,134,2019,1),(135,'TX135',35,'Male',15,135,135,2019,1),(136,'TX136',31,'Female',16,136,136,2019,1),(137,'TX137',43,'Male',17,137,137,2020,1),(138,'TX138',26,'Female',18,138,138,2020,1),(139,'TX139',30,'Male',19,139,139,2020,1),(140,'TX140',37,'Female',20,140,140,2020,1),(141,'TX141',28,'Male',1,141,141,2020,1),(142,'TX142',34,'Female',2,142,142,2020,1),(143,'TX143',22,'Male',3,143,143,2020,1),(144,'TX144',45,'Female',4,144,144,2020,1),(145,'TX145',31,'Male',5,145,145,2020,1),(146,'TX146',27,'Female',6,146,146,2020,1),(147,'TX147',40,'Male',7,147,147,2020,1),(148,'TX148',24,'Female',8,148,148,2020,1),(149,'TX149',38,'Male',9,149,149,2020,1),(150,'TX150',30,'Female',10,150,150,2020,1);
 /*!40000 ALTER TABLE `immigrants` ENABLE KEYS */;
 UNLOCK TABLES;
+
+--
+-- Table structure for table `immigrants_archive`
+--
+
+DROP TABLE IF EXISTS `immigrants_archive`;
+/*!40101 SET @saved_cs_client     = @@character_set_client */;
+/*!50503 SET character_set_client = utf8mb4 */;
+CREATE TABLE `immigrants_archive` (
+  `immigrant_id` int NOT NULL,
+  `case_id` varchar(50) DEFAULT NULL,
+  `age` int DEFAULT NULL,
+  `gender` varchar(20) DEFAULT NULL,
+  `country_id` int DEFAULT NULL,
+  `custody_id` int DEFAULT NULL,
+  `legal_id` int DEFAULT NULL,
+  `arrival_year` int DEFAULT NULL,
+  `version` int NOT NULL DEFAULT '1',
+  PRIMARY KEY (`immigrant_id`),
+  UNIQUE KEY `case_id` (`case_id`),
+  KEY `idx_archive_country` (`country_id`),
+  KEY `idx_archive_arrival_year` (`arrival_year`)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_0900_ai_ci;
+/*!40101 SET character_set_client = @saved_cs_client */;
+
+--
+-- View over current and archived rows of `immigrants`
+--
+
+DROP VIEW IF EXISTS `immigrants_all`;
+CREATE VIEW `immigrants_all` AS SELECT t.*, 0 AS archived FROM `immigrants` t UNION ALL SELECT a.*, 1 AS archived FROM `immigrants_archive` a;
+
+--
+-- Table structure for table `case_ids`
+--
+
+DROP TABLE IF EXISTS `case_ids`;
+/*!40101 SET @saved_cs_client     = @@character_set_client */;
+/*!50503 SET character_set_client = utf8mb4 */;
+CREATE TABLE `case_ids` (
+  `case_id` varchar(50) NOT NULL,
+  PRIMARY KEY (`case_id`)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_0900_ai_ci;
+/*!40101 SET character_set_client = @saved_cs_client */;
+
+--
+-- Dumping data for table `case_ids`
+--
+
+LOCK TABLES `case_ids` WRITE;
+/*!40000 ALTER TABLE `case_ids` DISABLE KEYS */;
+INSERT INTO `case_ids` VALUES ('TX001'),('TX002'),('TX003'),('TX004'),('TX005'),('TX006'),('TX007'),('TX008'),('TX009'),('TX010'),('TX011'),('TX012'),('TX013'),('TX014'),('TX015'),('TX016'),('TX017'),('TX018'),('TX019'),('TX020'),('TX021'),('TX022'),('TX023'),('TX024'),('TX025'),('TX026'),('TX027'),('TX028'),('TX029'),('TX030'),('TX031'),('TX032'),('TX033'),('TX034'),('TX035'),('TX036'),('TX037'),('TX038'),('TX039'),('TX040'),('TX041'),('TX042'),('TX043'),('TX044'),('TX045'),('TX046'),('TX047'),('TX048'),('TX049'),('TX050'),('TX051'),('TX052'),('TX053'),('TX054'),('TX055'),('TX056'),('TX057'),('TX058'),('TX059'),('TX060'),('TX061'),('TX062'),('TX063'),('TX064'),('TX065'),('TX066'),('TX067'),('TX068'),('TX069'),('TX070'),('TX071'),('TX072'),('TX073'),('TX074'),('TX075'),('TX076'),('TX077'),('TX078'),('TX079'),('TX080'),('TX081'),('TX082'),('TX083'),('TX084'),('TX085'),('TX086'),('TX087'),('TX088'),('TX089'),('TX090'),('TX091'),('TX092'),('TX093'),('TX094'),('TX095'),('TX096'),('TX097'),('TX098'),('TX099'),('TX100'),('TX101'),('TX102'),('TX103'),('TX104'),('TX105'),('TX106'),('TX107'),('TX108'),('TX109'),('TX110'),('TX111'),('TX112'),('TX113'),('TX114'),('TX115'),('TX116'),('TX117'),('TX118'),('TX119'),('TX120'),('TX121'),('TX122'),('TX123'),('TX124'),('TX125'),('TX126'),('TX127'),('TX128'),('TX129'),('TX130'),('TX131'),('TX132'),('TX133'),('TX134'),('TX135'),('TX136'),('TX137'),('TX138'),('TX139'),('TX140'),('TX141'),('TX142'),('TX143'),('TX144'),('TX145'),('TX146'),('TX147'),('TX148'),('TX149'),('TX150');
+/*!40000 ALTER TABLE `case_ids` ENABLE KEYS */;
+UNLOCK TABLES;
 /*!40103 SET TIME_ZONE=@OLD_TIME_ZONE */;
 
 /*!40101 SET SQL_MODE=@OLD_SQL_MODE */;
@@ -43,6 +43,32 @@ LOCK TABLES `legalrepresentation` WRITE;
 INSERT INTO `legalrepresentation` VALUES (1,'TX001','Has a lawyer','Maria Gomez','Texas Legal Aid','2016-09-20'),(2,'TX002','No lawyer',NULL,NULL,'2016-11-05'),(3,'TX003','Has a lawyer','James Lee','Houston Immigrant Rights','2016-12-10'),(4,'TX004','No lawyer',NULL,NULL,'2017-04-02'),(5,'TX005','Has a lawyer','Lucia Ramos','Refugee Legal Network','2017-05-25'),(6,'TX006','Has a lawyer','Carlos Rivera','Texas Justice Center','2017-11-18'),(7,'TX007','No lawyer',NULL,NULL,'2017-12-12'),(8,'TX008','Has a lawyer','Juan Perez','Houston Legal Services','2018-02-28'),(9,'TX009','No lawyer',NULL,NULL,'2018-06-18'),(10,'TX010','Has a lawyer','Sara Patel','Immigration Defense Fund','2018-07-03'),(11,'TX011','Has a lawyer','Angela Cruz','Border Rights Center','2018-08-30'),(12,'TX012','No lawyer',NULL,NULL,'2018-11-20'),(13,'TX013','Has a lawyer','Miguel Torres','El Paso Legal Aid','2019-03-25'),(14,'TX014','Has a lawyer','Linda Wu','Texas Refugee Network','2019-05-12'),(15,'TX015','No lawyer',NULL,NULL,'2019-07-12'),(16,'TX016','Has a lawyer','Omar Silva','Catholic Charities','2019-08-23'),(17,'TX017','No lawyer',NULL,NULL,'2019-10-03'),(18,'TX018','Has a lawyer','Daniela Lopez','Houston Justice Alliance','2019-11-15'),(19,'TX019','Has a lawyer','Ali Khan','El Paso Legal Aid','2020-01-30'),(20,'TX020','No lawyer',NULL,NULL,'2020-03-25'),(21,'TX021','Has a lawyer','Rebecca White','Texas Legal Center','2020-05-15'),(22,'TX022','Has a lawyer','Miguel Sanchez','Refugee Assistance Texas','2020-08-30'),(23,'TX023','No lawyer',NULL,NULL,'2020-11-02'),(24,'TX024','Has a lawyer','Emily Tran','Immigrant Rights Coalition','2021-02-22'),(25,'TX025','Has a lawyer','David Flores','Texas Justice Network','2021-06-10'),(26,'TX026','No lawyer',NULL,NULL,'2021-08-28'),(27,'TX027','Has a lawyer','Hannah Brown','Houston Legal Support','2022-01-05'),(28,'TX028','Has a lawyer','Isabel Reyes','El Paso Refugee Legal Aid','2022-03-10'),(29,'TX029','No lawyer',NULL,NULL,'2022-06-15'),(30,'TX030','Has a lawyer','Kofi Adeyemi','African Immigration Council','2022-09-01'),(31,'TX031','Has a lawyer','Alicia Herrera','Texas Immigrant Rights Group','2022-11-15'),(32,'TX032','No lawyer',NULL,NULL,'2023-01-25'),(33,'TX033','Has a lawyer','Marco Diaz','Houston Refugee Aid','2023-02-05'),(34,'TX034','Has a lawyer','Priya Nair','Texas Legal Advocates','2023-03-18'),(35,'TX035','No lawyer',NULL,NULL,'2023-04-29'),(36,'TX036','Has a lawyer','David Johnson','Border Legal Services','2023-06-20'),(37,'TX037','No lawyer',NULL,NULL,'2023-08-12'),(38,'TX038','Has a lawyer','Fatima Ali','Houston Justice Network','2023-09-25'),(39,'TX039','Has a lawyer','Juan Castillo','Refugee Legal Aid Texas','2023-10-02'),(40,'TX040','No lawyer',NULL,NULL,'2023-11-30'),(41,'TX041','Has a lawyer','Sophia Zhang','Immigrant Defense Coalition','2024-01-25'),(42,'TX042','No lawyer',NULL,NULL,'2024-02-10'),(43,'TX043','Has a lawyer','Luis Herrera','Texas Justice Collective','2024-03-20'),(44,'TX044','Has a lawyer','Emma Green','Port Isabel Legal Assistance','2024-05-15'),(45,'TX045','No lawyer',NULL,NULL,'2024-06-30'),(46,'TX046','Has a lawyer','Rita Patel','El Paso Legal Center','2024-07-20'),(47,'TX047','No lawyer',NULL,NULL,'2024-08-01'),(48,'TX048','Has a lawyer','Francisco Torres','Houston Legal Aid','2024-08-30'),(49,'TX049','Has a lawyer','Daniel Lee','Texas Immigrant Alliance','2024-09-28'),(50,'TX050','No lawyer',NULL,NULL,'2024-10-25'),(51,'TX051','Has a lawyer','Lucia Delgado','Texas Legal Aid','2012-04-18'),(52,'TX052','No lawyer',NULL,NULL,'2012-06-25'),(53,'TX053','Has a lawyer','Rajiv Mehta','Immigrant Justice Center','2012-07-10'),(54,'TX054','Has a lawyer','Fatima Noor','Border Rights Network','2013-01-25'),(55,'TX055','No lawyer',NULL,NULL,'2013-03-10'),(56,'TX056','Has a lawyer','Luis Ortega','Refugee Legal Alliance','2013-07-20'),(57,'TX057','No lawyer',NULL,NULL,'2013-08-05'),(58,'TX058','Has a lawyer','Emily Tran','Houston Immigrant Rights','2014-02-15'),(59,'TX059','Has a lawyer','Daniela Lopez','Texas Justice Network','2014-04-28'),(60,'TX060','No lawyer',NULL,NULL,'2014-05-10'),(61,'TX061','Has a lawyer','Omar Silva','Catholic Charities','2014-08-25'),(62,'TX062','Has a lawyer','Angela Cruz','Border Rights Center','2015-01-20'),(63,'TX063','No lawyer',NULL,NULL,'2015-02-05'),(64,'TX064','Has a lawyer','Ali Khan','El Paso Legal Aid','2015-04-05'),(65,'TX065','No lawyer',NULL,NULL,'2015-06-18'),(66,'TX066','Has a lawyer','Rebecca White','Texas Legal Center','2015-09-30'),(67,'TX067','Has a lawyer','Isabel Reyes','El Paso Refugee Legal Aid','2016-02-22'),(68,'TX068','No lawyer',NULL,NULL,'2016-04-15'),(69,'TX069','Has a lawyer','Kofi Adeyemi','African Immigration Council','2016-07-05'),(70,'TX070','No lawyer',NULL,NULL,'2016-08-20'),(71,'TX071','Has a lawyer','Maria Gomez','Texas Legal Aid','2016-07-28'),(72,'TX072','Has a lawyer','James Lee','Houston Immigrant Rights','2017-01-10'),(73,'TX073','No lawyer',NULL,NULL,'2017-02-25'),(74,'TX074','Has a lawyer','Lucia Ramos','Refugee Legal Network','2017-03-30'),(75,'TX075','No lawyer',NULL,NULL,'2017-06-10'),(76,'TX076','Has a lawyer','Carlos Rivera','Texas Justice Center','2017-08-25'),(77,'TX077','Has a lawyer','Juan Perez','Houston Legal Services','2018-01-15'),(78,'TX078','No lawyer',NULL,NULL,'2018-03-05'),(79,'TX079','Has a lawyer','Sara Patel','Immigration Defense Fund','2018-06-01'),(80,'TX080','No lawyer',NULL,NULL,'2018-07-20'),(81,'TX081','Has a lawyer','Emily Tran','Immigrant Rights Coalition','2018-06-15'),(82,'TX082','Has a lawyer','David Flores','Texas Justice Network','2018-09-10'),(83,'TX083','No lawyer',NULL,NULL,'2019-01-20'),(84,'TX084','Has a lawyer','Hannah Brown','Houston Legal Support','2019-03-25'),(85,'TX085','No lawyer',NULL,NULL,'2019-06-10'),(86,'TX086','Has a lawyer','Isabel Reyes','El Paso Refugee Legal Aid','2019-08-05'),(87,'TX087','Has a lawyer','Kofi Adeyemi','African Immigration Council','2020-01-15'),(88,'TX088','No lawyer',NULL,NULL,'2020-03-10'),(89,'TX089','Has a lawyer','Lucia Delgado','Texas Legal Aid','2020-05-05'),(90,'TX090','Has a lawyer','Rajiv Mehta','Immigrant Justice Center','2020-07-01'),(91,'TX091','No lawyer',NULL,NULL,'2020-08-18'),(92,'TX092','Has a lawyer','Fatima Noor','Border Rights Network','2020-09-25'),(93,'TX093','No lawyer',NULL,NULL,'2020-10-30'),(94,'TX094','Has a lawyer','Luis Ortega','Refugee Legal Alliance','2020-11-15'),(95,'TX095','Has a lawyer','Emily Tran','Houston Immigrant Rights','2020-12-01'),(96,'TX096','No lawyer',NULL,NULL,'2020-12-10'),(97,'TX097','Has a lawyer','Daniela Lopez','Texas Justice Network','2020-12-15'),(98,'TX098','No lawyer',NULL,NULL,'2020-12-20'),(99,'TX099','Has a lawyer','Omar Silva','Catholic Charities','2020-12-28'),(100,'TX100','No lawyer',NULL,NULL,'2020-12-31'),(101,'TX101','Has a lawyer','Lucia Delgado','Texas Legal Aid','2012-03-20'),(102,'TX102','No lawyer',NULL,NULL,'2012-04-15'),(103,'TX103','Has a lawyer','Rajiv Mehta','Immigrant Justice Center','2012-05-25'),(104,'TX104','Has a lawyer','Fatima Noor','Border Rights Network','2012-06-22'),(105,'TX105','No lawyer',NULL,NULL,'2013-01-18'),(106,'TX106','Has a lawyer','Luis Ortega','Refugee Legal Alliance','2013-02-20'),(107,'TX107','No lawyer',NULL,NULL,'2013-03-25'),(108,'TX108','Has a lawyer','Emily Tran','Houston Immigrant Rights','2013-04-30'),(109,'TX109','Has a lawyer','Daniela Lopez','Texas Justice Network','2013-06-05'),(110,'TX110','No lawyer',NULL,NULL,'2013-06-25'),(111,'TX111','Has a lawyer','Omar Silva','Catholic Charities','2014-01-15'),(112,'TX112','Has a lawyer','Angela Cruz','Border Rights Center','2014-02-18'),(113,'TX113','No lawyer',NULL,NULL,'2014-03-22'),(114,'TX114','Has a lawyer','Ali Khan','El Paso Legal Aid','2014-04-28'),(115,'TX115','No lawyer',NULL,NULL,'2014-05-30'),(116,'TX116','Has a lawyer','Rebecca White','Texas Legal Center','2014-06-25'),(117,'TX117','Has a lawyer','Isabel Reyes','El Paso Refugee Legal Aid','2015-01-20'),(118,'TX118','No lawyer',NULL,NULL,'2015-02-25'),(119,'TX119','Has a lawyer','Kofi Adeyemi','African Immigration Council','2015-03-30'),(120,'TX120','No lawyer',NULL,NULL,'2015-04-22'),(121,'TX121','Has a lawyer','Maria Gomez','Texas Legal Aid','2016-01-15'),(122,'TX122','Has a lawyer','James Lee','Houston Immigrant Rights','2016-02-20'),(123,'TX123','No lawyer',NULL,NULL,'2016-03-25'),(124,'TX124','Has a lawyer','Lucia Ramos','Refugee Legal Network','2016-04-30'),(125,'TX125','No lawyer',NULL,NULL,'2017-01-18'),(126,'TX126','Has a lawyer','Carlos Rivera','Texas Justice Center','2017-02-22'),(127,'TX127','Has a lawyer','Juan Perez','Houston Legal Services','2017-03-28'),(128,'TX128','No lawyer',NULL,NULL,'2017-04-30'),(129,'TX129','Has a lawyer','Sara Patel','Immigration Defense Fund','2018-01-30'),(130,'TX130','No lawyer',NULL,NULL,'2018-02-25'),(131,'TX131','Has a lawyer','Emily Tran','Immigrant Rights Coalition','2018-03-30'),(132,'TX132','Has a lawyer','David Flores','Texas Justice Network','2018-04-22'),(133,'TX133','No lawyer',NULL,NULL,'2019-01-15'),(134,'TX134','Has a lawyer','Hannah Brown','Houston Legal Support','2019-02-20'),(135,'TX135','No lawyer',NULL,NULL,'2019-03-25'),(136,'TX136','Has a lawyer','Isabel Reyes','El Paso Refugee Legal Aid','2019-04-30'),(137,'TX137','Has a lawyer','Kofi Adeyemi','African Immigration Council','2020-01-12'),(138,'TX138','No lawyer',NULL,NULL,'2020-02-14'),(139,'TX139','Has a lawyer','Lucia Delgado','Texas Legal Aid','2020-03-20'),(140,'TX140','Has a lawyer','Rajiv Mehta','Immigrant Justice Center','2020-04-25'),(141,'TX141','No lawyer',NULL,NULL,'2020-05-30'),(142,'TX142','Has a lawyer','Fatima Noor','Border Rights Network','2020-06-18'),(143,'TX143','No lawyer',NULL,NULL,'2020-07-10'),(144,'TX144','Has a lawyer','Luis Ortega','Refugee Legal Alliance','2020-08-12'),(145,'TX145','Has a lawyer','Emily Tran','Houston Immigrant Rights','2020-09-15'),(146,'TX146','No lawyer',NULL,NULL,'2020-10-20'),(147,'TX147','Has a lawyer','Daniela Lopez','Texas Justice Network','2020-11-25'),(148,'TX148','No lawyer',NULL,NULL,'2020-12-30'),(149,'TX149','Has a lawyer','Omar Silva','Catholic Charities','2020-12-31'),(150,'TX150','No lawyer',NULL,NULL,'2020-12-31');
 /*!40000 ALTER TABLE `legalrepresentation` ENABLE KEYS */;
 UNLOCK TABLES;
+
+--
+-- Table structure for table `legalrepresentation_archive`
+--
+
+DROP TABLE IF EXISTS `legalrepresentation_archive`;
+/*!40101 SET @saved_cs_client     = @@character_set_client */;
+/*!50503 SET character_set_client = utf8mb4 */;
+CREATE TABLE `legalrepresentation_archive` (
+  `legal_id` int NOT NULL,
+  `case_id` varchar(50) DEFAULT NULL,
+  `representation_status` varchar(50) DEFAULT NULL,
+  `attorney_name` varchar(150) DEFAULT NULL,
+  `organization` varchar(150) DEFAULT NULL,
+  `hearing_date` date DEFAULT NULL,
+  PRIMARY KEY (`legal_id`),
+  KEY `idx_archive_case` (`case_id`)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_0900_ai_ci;
+/*!40101 SET character_set_client = @saved_cs_client */;
+
+--
+-- View over current and archived rows of `legalrepresentation`
+--
+
+DROP VIEW IF EXISTS `legalrepresentation_all`;
+CREATE VIEW `legalrepresentation_all` AS SELECT t.*, 0 AS archived FROM `legalrepresentation` t UNION ALL SELECT a.*, 1 AS archived FROM `legalrepresentation_archive` a;
 /*!40103 SET TIME_ZONE=@OLD_TIME_ZONE */;
 
 /*!40101 SET SQL_MODE=@OLD_SQL_MODE */;
@@ -1,7 +1,17 @@
+import collections
+import contextlib
+import datetime
+import itertools
 import os
+import queue
+import threading
+import time
 import tkinter as tk
 from tkinter import ttk, messagebox
 import mysql.connector as mysql
+from mysql.connector import errorcode
+
+from queries import QUERIES, UNPREPARED, REPLICA_READS, ROLLUP_METRICS, SAMPLE_PARAMS
 
 # Optional .env support
 try:
@@ -10,6 +20,15 @@ try:
 except Exception:
     pass
 
+# Read replicas as "host:port,host:port"; they share the primary's user, password and database
+def parse_replicas(spec):
+    replicas = []
+    for item in spec.split(","):
+        host, _, port = item.strip().partition(":")
+        if host:
+            replicas.append({"host": host, "port": int(port or "3306")})
+    return replicas
+
 DB_CFG = {
     "host": os.getenv("DB_HOST", "127.0.0.1"),
     "port": int(os.getenv("DB_PORT", "3306")),
@@ -17,29 +36,344 @@ DB_CFG = {
     "password": os.getenv("DB_PASSWORD", "4421"),
     "database": os.getenv("DB_NAME", "Immigrant_Integration"),
     "autocommit": True,
+    "replicas": parse_replicas(os.getenv("DB_REPLICAS", "")),
 }
 
-def get_conn():
-    return mysql.connect(**DB_CFG)
+POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+# Idle pooled connections older than this are pinged before reuse, in case the server dropped them
+POOL_PING_AFTER = float(os.getenv("DB_POOL_PING_AFTER", "30"))
+# A replica further behind the primary than this is skipped
+MAX_REPLICA_LAG = int(os.getenv("DB_MAX_REPLICA_LAG", "5"))
+# After a write, reads stay on the primary this long so the user sees their own change
+READ_YOUR_WRITES_SECONDS = float(os.getenv("DB_READ_YOUR_WRITES", "5"))
+LAG_CHECK_SECONDS = 5
+# A replica that is down is probed again after a delay that doubles up to this limit
+MAX_REPLICA_BACKOFF = 300
+# Replica connects give up quickly so an unreachable host does not freeze the window
+REPLICA_CONNECT_TIMEOUT = int(os.getenv("DB_REPLICA_CONNECT_TIMEOUT", "2"))
+# Accept a server that is not replicating (no SHOW REPLICA STATUS row) as a replica, for local testing
+ALLOW_STANDALONE_REPLICA = os.getenv("DB_ALLOW_STANDALONE_REPLICA", "").lower() in ("1", "true", "yes")
+# A save to a case waits this long for another save to the same case to finish
+CASE_LOCK_TIMEOUT = 10
+
+# A connection plus the prepared statements already created on it
+class PooledConn:
+    def __init__(self, cfg):
+        self.cnx = mysql.connect(**cfg)
+        self.stmts = {}
+        self.last_used = time.monotonic()
+
+    def cursor_for(self, name):
+        if name in UNPREPARED:
+            return self.cnx.cursor()
+        cur = self.stmts.get(name)
+        if cur is None:
+            cur = self.stmts[name] = self.cnx.cursor(prepared=True)
+        return cur
+
+    def close(self):
+        try:
+            self.cnx.close()
+        except mysql.Error:
+            pass
+
+# Keeps up to `size` idle connections so their prepared statements survive between calls
+class ConnectionPool:
+    def __init__(self, cfg, size):
+        self.cfg = cfg
+        self.idle = queue.LifoQueue(maxsize=size)
+
+    # Returns an idle connection that still answers, or a new one. A dropped connection is
+    # discarded together with its prepared statements, which the server no longer has.
+    def acquire(self):
+        while True:
+            try:
+                conn = self.idle.get_nowait()
+            except queue.Empty:
+                return PooledConn(self.cfg)
+            if time.monotonic() - conn.last_used < POOL_PING_AFTER:
+                return conn
+            try:
+                conn.cnx.ping()
+                return conn
+            except mysql.Error:
+                conn.close()
+
+    def release(self, conn, broken=False):
+        conn.last_used = time.monotonic()
+        if not broken:
+            try:
+                self.idle.put_nowait(conn)
+                return
+            except queue.Full:
+                pass
+        conn.close()
 
-def run_select(sql, params=None):
-    conn = get_conn()
+# A read replica with its own pool and a cached view of how far behind it is
+class Replica:
+    def __init__(self, cfg, size):
+        self.name = f"{cfg['host']}:{cfg['port']}"
+        self.pool = ConnectionPool(cfg, size)
+        self.checked_at = None
+        self.healthy = False
+        self.retry_after = LAG_CHECK_SECONDS
+
+    def usable(self):
+        now = time.monotonic()
+        if self.checked_at is None or now - self.checked_at >= self.retry_after:
+            self.checked_at = now
+            if self.lag_ok():
+                self.healthy = True
+                self.retry_after = LAG_CHECK_SECONDS
+            else:
+                self.mark_down()
+        return self.healthy
+
+    def lag_ok(self):
+        try:
+            status = _execute(self.pool, "replica_status", fetch=True)
+        except mysql.Error:
+            return False
+        # An instance that is not replicating has no status row; only a configured stand-in may serve reads
+        if not status:
+            return ALLOW_STANDALONE_REPLICA
+        lag = status[0].get("Seconds_Behind_Source")
+        return lag is not None and lag <= MAX_REPLICA_LAG
+
+    def mark_down(self):
+        if self.healthy:
+            self.retry_after = LAG_CHECK_SECONDS
+        else:
+            self.retry_after = min(self.retry_after * 2, MAX_REPLICA_BACKOFF)
+        self.healthy = False
+        self.checked_at = time.monotonic()
+
+PRIMARY_CFG = {k: v for k, v in DB_CFG.items() if k != "replicas"}
+PRIMARY = ConnectionPool(PRIMARY_CFG, POOL_SIZE)
+REPLICAS = [Replica({**PRIMARY_CFG, "connection_timeout": REPLICA_CONNECT_TIMEOUT, **r}, POOL_SIZE)
+            for r in DB_CFG["replicas"]]
+_replica_cycle = itertools.cycle(REPLICAS)
+_last_write = float("-inf")
+
+QUERY_STATS = {}
+_stats_lock = threading.Lock()
+
+def _record_stats(name, elapsed, rows, on_replica):
+    with _stats_lock:
+        st = QUERY_STATS.setdefault(name, {"calls": 0, "replica_calls": 0, "rows": 0, "total_ms": 0.0, "max_ms": 0.0})
+        st["calls"] += 1
+        st["replica_calls"] += on_replica
+        st["rows"] += rows
+        st["total_ms"] += elapsed * 1000
+        st["max_ms"] = max(st["max_ms"], elapsed * 1000)
+
+def query_stats():
+    with _stats_lock:
+        return [{"statement": name, "calls": st["calls"], "replica_calls": st["replica_calls"], "rows": st["rows"],
+                 "avg_ms": round(st["total_ms"] / st["calls"], 2), "max_ms": round(st["max_ms"], 2),
+                 "total_ms": round(st["total_ms"], 2)}
+                for name, st in sorted(QUERY_STATS.items(), key=lambda kv: -kv[1]["total_ms"])]
+
+# Runs a registered statement by name on a checked-out connection; returns rows for SELECTs,
+# (lastrowid, rowcount) otherwise
+def _run_on(conn, name, params, fetch, on_replica=False):
+    start = time.perf_counter()
+    cur = conn.cursor_for(name)
+    cur.execute(QUERIES[name], params or ())
+    if fetch:
+        cols = cur.column_names
+        result = [dict(zip(cols, r)) for r in cur.fetchall()]
+        count = len(result)
+    else:
+        result = (cur.lastrowid, cur.rowcount)
+        count = cur.rowcount
+    if name in UNPREPARED:
+        cur.close()
+    _record_stats(name, time.perf_counter() - start, max(count, 0), on_replica)
+    return result
+
+def _execute_on(pool, conn, name, params, fetch):
+    broken = False
     try:
-        cur = conn.cursor(dictionary=True)
-        cur.execute(sql, params or ())
-        return cur.fetchall()
+        result = _run_on(conn, name, params, fetch, pool is not PRIMARY)
+        if not fetch:
+            conn.cnx.commit()
+        return result
+    except (mysql.InterfaceError, mysql.OperationalError):
+        broken = True
+        raise
     finally:
-        conn.close()
+        pool.release(conn, broken)
 
-def run_exec(sql, params=None):
-    conn = get_conn()
+def _execute(pool, name, params=None, fetch=False):
+    try:
+        return _execute_on(pool, pool.acquire(), name, params, fetch)
+    except (mysql.InterfaceError, mysql.OperationalError):
+        # A read on a connection the server dropped since the ping check is repeated once on a
+        # fresh connection; a write may already have been applied, so it is not retried
+        if not fetch:
+            raise
+        return _execute_on(pool, PooledConn(pool.cfg), name, params, fetch)
+
+def pick_replica(name):
+    if name not in REPLICA_READS or not REPLICAS:
+        return None
+    if time.monotonic() - _last_write < READ_YOUR_WRITES_SECONDS:
+        return None
+    for _ in range(len(REPLICAS)):
+        replica = next(_replica_cycle)
+        if replica.usable():
+            return replica
+    return None
+
+def run_select(name, params=None):
+    replica = pick_replica(name)
+    if replica:
+        try:
+            return _execute(replica.pool, name, params, fetch=True)
+        except mysql.Error:
+            # Replica went away or timed out connecting (ConnectionTimeoutError is neither an Interface-
+            # nor an OperationalError); answer from the primary and skip it until the next lag check
+            replica.mark_down()
+    return _execute(PRIMARY, name, params, fetch=True)
+
+def _write(name, params):
+    global _last_write
+    result = _execute(PRIMARY, name, params)
+    # AUTO_INCREMENT resets do not change any rows, so they do not pin reads to the primary
+    if name not in UNPREPARED:
+        _last_write = time.monotonic()
+    return result
+
+def run_exec(name, params=None):
+    return _write(name, params)[0]
+
+# Returns the number of rows matched, used for version-checked updates
+def run_update(name, params=None):
+    return _write(name, params)[1]
+
+# Runs (name, params) steps on the primary as one transaction; returns each step's row count
+# `lock_name` is a named server lock held from before the transaction starts until after it ends
+@contextlib.contextmanager
+def _transaction(isolation_level=None, lock_name=None):
+    global _last_write
+    conn = PRIMARY.acquire()
+    broken = locked = False
     try:
-        cur = conn.cursor()
-        cur.execute(sql, params or ())
-        conn.commit()
-        return cur.lastrowid
+        if lock_name:
+            locked = _run_on(conn, "lock_get", (lock_name, CASE_LOCK_TIMEOUT), fetch=True)[0]["locked"] == 1
+            if not locked:
+                raise TimeoutError("Another user is saving this case. Please try again.")
+        conn.cnx.start_transaction(isolation_level=isolation_level)
+        yield conn
+        conn.cnx.commit()
+        _last_write = time.monotonic()
+    except (mysql.InterfaceError, mysql.OperationalError):
+        broken = True
+        raise
+    except Exception:
+        conn.cnx.rollback()
+        raise
     finally:
-        conn.close()
+        if locked and not broken:
+            try:
+                _run_on(conn, "lock_release", (lock_name,), fetch=True)
+            except mysql.Error:
+                broken = True
+        PRIMARY.release(conn, broken)
+
+def run_tx(steps):
+    with _transaction() as conn:
+        return [_run_on(conn, name, params, fetch=False)[1] for name, params in steps]
+
+def _day_and_month(day):
+    return (("day", day), ("month", day.replace(day=1)))
+
+# Rollup buckets of one case from its immigrant, custody and legal rows,
+# as a Counter keyed by the case_rollup key columns
+def rollup_buckets(immigrants, custody, legal, metrics=ROLLUP_METRICS):
+    buckets = collections.Counter()
+    country = (immigrants[0]["country_id"] if immigrants else None) or 0
+    if "arrival" in metrics:
+        # The case's own latest custody record
+        latest = max(custody, key=lambda cs: cs["custody_id"], default={})
+        # Years a DATE cannot hold are saved on the case but left out of the rollup
+        for imm in immigrants:
+            if 0 < (imm["arrival_year"] or 0) <= datetime.MAXYEAR:
+                buckets["arrival", "year", datetime.date(imm["arrival_year"], 1, 1), country,
+                        latest.get("custody_type") or "", ""] += 1
+    if "release" in metrics:
+        for cs in custody:
+            if cs["release_date"]:
+                for grain, day in _day_and_month(cs["release_date"]):
+                    buckets["release", grain, day, country, cs["custody_type"] or "", ""] += 1
+    if "hearing" in metrics:
+        for l in legal:
+            if l["hearing_date"]:
+                for grain, day in _day_and_month(l["hearing_date"]):
+                    buckets["hearing", grain, day, country, "", l["organization"] or ""] += 1
+    return buckets
+
+def _case_buckets(conn, case_id, metrics):
+    if not metrics:
+        return collections.Counter()
+    read = lambda name: _run_on(conn, name, (case_id, case_id), fetch=True)
+    custody = read("rollup_case_custody") if "arrival" in metrics or "release" in metrics else []
+    legal = read("rollup_case_legal") if "hearing" in metrics else []
+    return rollup_buckets(read("rollup_case_immigrant"), custody, legal, metrics)
+
+# Runs writes to one case and moves its rollup buckets in the same transaction: the case's rows are read
+# by case_id before and after the writes, and only buckets whose count changed are upserted.
+# READ COMMITTED keeps those reads from share-locking rows the writes do not touch. Saves to the same
+# case take turns on a lock named after it, so the reads never see another save commit in between;
+# a named lock also covers case IDs that have no row yet.
+def run_case_tx(case_id, steps, metrics=ROLLUP_METRICS):
+    with _transaction("READ COMMITTED", lock_name=f"case:{case_id}") as conn:
+        before = _case_buckets(conn, case_id, metrics)
+        counts = [_run_on(conn, name, params, fetch=False)[1] for name, params in steps]
+        delta = _case_buckets(conn, case_id, metrics)
+        delta.subtract(before)
+        for key, cnt in delta.items():
+            if cnt:
+                _run_on(conn, "rollup_add", key + (cnt,), fetch=False)
+        return counts
+
+def rebuild_rollups():
+    return run_tx([("rollup_clear", None)] + [(f"rollup_{m}_rebuild", None) for m in ROLLUP_METRICS])
+
+# First day of the month `n` months after the month of `day`
+def month_start(day, n=0):
+    months = day.year * 12 + day.month - 1 + n
+    return datetime.date(months // 12, months % 12 + 1, 1)
+
+# EXPLAIN every registered statement, binding SAMPLE_PARAMS or NULL to its placeholders.
+# Returns ({name: plan rows}, {name: error message}); one failing statement does not stop the rest.
+def explain_all():
+    plans, errors = {}, {}
+    conn = PRIMARY.acquire()
+    broken = False
+    try:
+        for name, sql in QUERIES.items():
+            if name in UNPREPARED:
+                continue
+            params = SAMPLE_PARAMS.get(name, (None,) * sql.count("%s"))
+            cur = conn.cnx.cursor(dictionary=True)
+            try:
+                cur.execute("EXPLAIN " + sql, params)
+                plans[name] = cur.fetchall()
+            except (mysql.InterfaceError, mysql.OperationalError):
+                broken = True
+                raise
+            except mysql.Error as e:
+                errors[name] = str(e)
+            finally:
+                cur.close()
+    finally:
+        PRIMARY.release(conn, broken)
+    return plans, errors
+
+def is_duplicate(err):
+    return isinstance(err, mysql.IntegrityError) and err.errno == errorcode.ER_DUP_ENTRY
 
 def fill_tree(tree: ttk.Treeview, rows):
     tree.delete(*tree.get_children())
@@ -56,6 +390,15 @@ def fill_tree(tree: ttk.Treeview, rows):
     for r in rows:
         tree.insert("", "end", values=[r.get(c, "") for c in cols])
 
+# Selects the row whose first column is row_id; returns False if it is no longer listed
+def select_row(tree: ttk.Treeview, row_id):
+    for item in tree.get_children():
+        if str(tree.item(item, "values")[0]) == str(row_id):
+            tree.selection_set(item)
+            tree.see(item)
+            return True
+    return False
+
 # --------------------------------------------------------------------
 
 # Able to add hints to entries
@@ -110,12 +453,19 @@ class App(tk.Tk):
         nb.add(self.tab_country, text="🌎 Country of Origin (CRUD)")
         nb.add(self.tab_analytics, text="📊 Analytics")
 
+        # Shared by the list views and analytics; off keeps queries on the working tables only
+        self.include_archive = tk.BooleanVar(value=False)
+
         self.build_immigrants()
         self.build_custody()
         self.build_legal()
         self.build_country()
         self.build_analytics()
 
+    # Name of the statement variant that also reads archived cases when the checkbox is on
+    def _archived(self, name):
+        return name + "_all" if self.include_archive.get() else name
+
     # ----------------------------------------------------------------
     # 1️⃣ Immigrants CRUD
     def build_immigrants(self):
@@ -126,6 +476,8 @@ class App(tk.Tk):
         lf.pack(fill="x", pady=6)
 
         self.i_id = tk.StringVar()
+        self.i_version = tk.StringVar()
+        self.i_archived = tk.StringVar()
         self.i_case = tk.StringVar()
         self.i_age = tk.StringVar()
         self.i_gender = tk.StringVar()
@@ -155,6 +507,8 @@ class App(tk.Tk):
         ttk.Button(btns, text="Update Selected", command=self.imm_update).pack(side="left", padx=4)
         ttk.Button(btns, text="Delete Selected", command=self.imm_delete).pack(side="left", padx=4)
         ttk.Button(btns, text="Refresh", command=self.imm_refresh).pack(side="left", padx=4)
+        ttk.Checkbutton(btns, text="Include archived cases", variable=self.include_archive,
+                        command=self.imm_refresh).pack(side="left", padx=4)
 
         self.tree_imm = ttk.Treeview(frm, height=18)
         self.tree_imm.pack(fill="both", expand=True)
@@ -165,9 +519,9 @@ class App(tk.Tk):
 
     def _reload_dropdowns(self):
         # Reload data for combo boxes
-        countries = run_select("SELECT country_id, country_name FROM CountryOfOrigin ORDER BY country_name")
-        custodies = run_select("SELECT custody_id, custody_type FROM CustodyStatus ORDER BY custody_id")
-        legals = run_select("SELECT legal_id, representation_status FROM LegalRepresentation ORDER BY legal_id")
+        countries = run_select("country_options")
+        custodies = run_select("custody_options")
+        legals = run_select("legal_options")
 
         self._country_lookup = {f"{r['country_name']}": r['country_id'] for r in countries}
         self._custody_lookup = {f"{r['custody_type']}": r['custody_id'] for r in custodies}
@@ -178,19 +532,11 @@ class App(tk.Tk):
         self.cmb_legal["values"] = list(self._legal_lookup.keys())
 
     def imm_refresh(self):
-        rows = run_select("""
-            SELECT i.immigrant_id, i.case_id, i.age, i.gender, 
-                   c.country_name, cs.custody_type, l.representation_status, i.arrival_year
-            FROM Immigrants i
-            LEFT JOIN CountryOfOrigin c ON c.country_id=i.country_id
-            LEFT JOIN CustodyStatus cs ON cs.custody_id=i.custody_id
-            LEFT JOIN LegalRepresentation l ON l.legal_id=i.legal_id
-            ORDER BY i.immigrant_id
-        """)
+        rows = run_select(self._archived("imm_list"))
         fill_tree(self.tree_imm, rows)
 
-        max_id = run_select("SELECT MAX(immigrant_id) AS max_id FROM Immigrants")[0]["max_id"] or 0
-        run_exec("ALTER TABLE Immigrants AUTO_INCREMENT = %s", (max_id + 1,))
+        max_id = run_select("imm_max_id")[0]["max_id"] or 0
+        run_exec("imm_reset_auto_increment", (max_id + 1,))
 
     def imm_on_select(self, _=None):
         sel = self.tree_imm.selection()
@@ -203,6 +549,8 @@ class App(tk.Tk):
         self.i_age.set(str(row.get("age", "")))
         self.i_gender.set(row.get("gender", ""))
         self.i_arrival.set(str(row.get("arrival_year", "")))
+        self.i_version.set(row.get("version", ""))
+        self.i_archived.set(row.get("archived", "0"))
         self.cmb_country.set(row.get("country_name", ""))
         self.cmb_custody.set(row.get("custody_type", ""))
         self.cmb_legal.set(row.get("representation_status", ""))
@@ -220,18 +568,14 @@ class App(tk.Tk):
         if not validate_fields(fields):
             return
         try:
-            existing = run_select("SELECT 1 FROM Immigrants WHERE case_id=%s", (self.i_case.get(),))
-            if existing:
-                messagebox.showerror("Duplicate Case", "This case ID already exists.")
-                return
-            # Creating immigrant
-            run_exec("""INSERT INTO immigrants (case_id, age, gender, country_id, custody_id, legal_id, arrival_year)
-                        VALUES (%s,%s,%s,%s,%s,%s,%s)""",
-                     (self.i_case.get(), int(self.i_age.get() or 0), self.i_gender.get(),
-                      self._country_lookup.get(self.cmb_country.get()),
-                      self._custody_lookup.get(self.cmb_custody.get()),
-                      self._legal_lookup.get(self.cmb_legal.get()),
-                      int(self.i_arrival.get() or 0)))
+            # Creating immigrant, case_ids rejects a case ID already used by a working or archived case
+            run_case_tx(self.i_case.get(), [
+                ("case_id_insert", (self.i_case.get(),)),
+                ("imm_insert", (self.i_case.get(), int(self.i_age.get() or 0), self.i_gender.get(),
+                                self._country_lookup.get(self.cmb_country.get()),
+                                self._custody_lookup.get(self.cmb_custody.get()),
+                                self._legal_lookup.get(self.cmb_legal.get()),
+                                int(self.i_arrival.get() or 0)))])
             messagebox.showinfo("Success", "Immigrant added.")
 
             self.show_custody_popup(self.i_case.get(), self.cmb_custody.get())
@@ -240,6 +584,9 @@ class App(tk.Tk):
             self.imm_refresh()
 
         except Exception as e:
+            if is_duplicate(e):
+                messagebox.showerror("Duplicate Case", "This case ID already exists.")
+                return
             messagebox.showerror("Error", str(e))
 
     # Allowing user to populate custody status table when creating an immigrant
@@ -286,9 +633,8 @@ class App(tk.Tk):
                 return
 
             try:
-                run_exec("""INSERT INTO CustodyStatus (case_id, custody_type, detention_facility, release_date, custody_outcome)
-                            VALUES (%s, %s, %s, %s, %s)""",
-                         (case_id, c_type.get(), c_fac.get(), sanitize_date(c_rel.get()), c_out.get()))
+                run_case_tx(case_id, [("custody_insert",
+                         (case_id, c_type.get(), c_fac.get(), sanitize_date(c_rel.get()), c_out.get()))], ("arrival", "release"))
                 self.cust_refresh()
                 popup.destroy()
             except Exception as e:
@@ -338,9 +684,8 @@ class App(tk.Tk):
                 return
 
             try:
-                run_exec("""INSERT INTO LegalRepresentation (case_id, representation_status, attorney_name, organization, hearing_date)
-                            VALUES (%s, %s, %s, %s, %s)""",
-                         (case_id, l_status.get(), l_att.get(), l_org.get(), l_date.get() or None))
+                run_case_tx(case_id, [("legal_insert",
+                         (case_id, l_status.get(), l_att.get(), l_org.get(), l_date.get() or None))], ("hearing",))
                 self.legal_refresh()
                 popup.destroy()
             except Exception as e:
@@ -348,12 +693,25 @@ class App(tk.Tk):
 
         ttk.Button(popup, text="Save", command=save).grid(row=4, column=0, columnspan=2, pady=10)
 
+    # Refills the form from the refreshed row so its version is current; clears it if the row is gone
+    def imm_reload_form(self, imm_id):
+        if select_row(self.tree_imm, imm_id):
+            self.imm_on_select()
+            return
+        for var in (self.i_id, self.i_case, self.i_age, self.i_gender, self.i_arrival, self.i_version, self.i_archived):
+            var.set("")
+        for cmb in (self.cmb_country, self.cmb_custody, self.cmb_legal):
+            cmb.set("")
+
     def imm_update(self):
         sel = self.tree_imm.selection()
         if not sel:
             messagebox.showwarning("Select row", "Pick a row first.")
             return
-        imm_id = self.tree_imm.item(sel[0], "values")[0]
+        imm_id, case_id = self.tree_imm.item(sel[0], "values")[:2]
+        if self.i_archived.get() == "1":
+            messagebox.showwarning("Archived", "Archived cases are read-only.")
+            return
 
         fields = {
             "Case ID": self.i_case.get(),
@@ -368,10 +726,15 @@ class App(tk.Tk):
             return
 
         try:
-            run_exec("""UPDATE Immigrants
-                        SET age=%s, gender=%s, arrival_year=%s
-                        WHERE immigrant_id=%s""",
-                     (int(self.i_age.get() or 0), self.i_gender.get(), int(self.i_arrival.get() or 0), imm_id))
+            # Only applies if nobody else saved this row since it was loaded
+            updated = run_case_tx(case_id, [("imm_update",
+                     (int(self.i_age.get() or 0), self.i_gender.get(), int(self.i_arrival.get() or 0),
+                      imm_id, self.i_version.get()))], ("arrival",))[0]
+            if not updated:
+                messagebox.showwarning("Conflict", "This record was changed by another user. Reloaded the latest version.")
+                self.imm_refresh()
+                self.imm_reload_form(imm_id)
+                return
             messagebox.showinfo("Updated", "Record updated.")
             self.imm_refresh()
         except Exception as e:
@@ -382,9 +745,11 @@ class App(tk.Tk):
         if not sel: return
         case_id = self.tree_imm.item(sel[0], "values")[1]
         try:
-            run_exec("DELETE FROM CustodyStatus WHERE case_id=%s", (case_id,))
-            run_exec("DELETE FROM LegalRepresentation WHERE case_id=%s", (case_id,))
-            run_exec("DELETE FROM Immigrants WHERE case_id=%s", (case_id,))
+            # The case may be in the working tables or the archive
+            run_case_tx(case_id, [(name, (case_id,)) for name in (
+                "custody_delete_by_case", "legal_delete_by_case", "imm_delete_by_case",
+                "custody_archive_delete_by_case", "legal_archive_delete_by_case", "imm_archive_delete_by_case",
+                "case_id_delete")])
             messagebox.showinfo("Deleted", "Record deleted across all tables.")
 
             self.imm_refresh()
@@ -426,17 +791,19 @@ class App(tk.Tk):
         btns = ttk.Frame(lf); btns.grid(row=2, column=0, columnspan=8, pady=5)
         ttk.Button(btns, text="Create", command=self.cust_create).pack(side="left", padx=4)
         ttk.Button(btns, text="Refresh", command=self.cust_refresh).pack(side="left", padx=4)
+        ttk.Checkbutton(btns, text="Include archived cases", variable=self.include_archive,
+                        command=self.cust_refresh).pack(side="left", padx=4)
 
         self.tree_cust = ttk.Treeview(frm, height=18)
         self.tree_cust.pack(fill="both", expand=True)
         self.cust_refresh()
 
     def cust_refresh(self):
-        rows = run_select("SELECT * FROM CustodyStatus ORDER BY custody_id")
+        rows = run_select(self._archived("custody_list"))
         fill_tree(self.tree_cust, rows)
 
-        max_id = run_select("SELECT MAX(custody_id) AS max_id FROM CustodyStatus")[0]["max_id"] or 0
-        run_exec("ALTER TABLE CustodyStatus AUTO_INCREMENT = %s", (max_id + 1,))
+        max_id = run_select("custody_max_id")[0]["max_id"] or 0
+        run_exec("custody_reset_auto_increment", (max_id + 1,))
 
     def cust_create(self):
         fields = {
@@ -449,10 +816,9 @@ class App(tk.Tk):
         if not validate_fields(fields):
             return
         try:
-            run_exec("""INSERT INTO CustodyStatus (case_id, custody_type, detention_facility, release_date, custody_outcome)
-                        VALUES (%s,%s,%s,%s,%s)""",
+            run_case_tx(self.c_case.get(), [("custody_insert",
                      (self.c_case.get(), self.c_type.get(), self.c_fac.get(),
-                      sanitize_date(self.c_rel.get()), self.c_outcome.get()))
+                      sanitize_date(self.c_rel.get()), self.c_outcome.get()))], ("arrival", "release"))
             messagebox.showinfo("Added", "Custody record added.")
             self.cust_refresh()
         except Exception as e:
@@ -490,17 +856,19 @@ class App(tk.Tk):
         btns = ttk.Frame(lf); btns.grid(row=2, column=0, columnspan=6, pady=5)
         ttk.Button(btns, text="Create", command=self.legal_create).pack(side="left", padx=4)
         ttk.Button(btns, text="Refresh", command=self.legal_refresh).pack(side="left", padx=4)
+        ttk.Checkbutton(btns, text="Include archived cases", variable=self.include_archive,
+                        command=self.legal_refresh).pack(side="left", padx=4)
 
         self.tree_legal = ttk.Treeview(frm, height=18)
         self.tree_legal.pack(fill="both", expand=True)
         self.legal_refresh()
 
     def legal_refresh(self):
-        rows = run_select("SELECT * FROM LegalRepresentation ORDER BY legal_id")
+        rows = run_select(self._archived("legal_list"))
         fill_tree(self.tree_legal, rows)
 
-        max_id = run_select("SELECT MAX(legal_id) AS max_id FROM LegalRepresentation")[0]["max_id"] or 0
-        run_exec("ALTER TABLE LegalRepresentation AUTO_INCREMENT = %s", (max_id + 1,))
+        max_id = run_select("legal_max_id")[0]["max_id"] or 0
+        run_exec("legal_reset_auto_increment", (max_id + 1,))
 
     def legal_create(self):
         fields = {
@@ -513,9 +881,9 @@ class App(tk.Tk):
         if not validate_fields(fields):
             return
         try:
-            run_exec("""INSERT INTO LegalRepresentation (case_id, representation_status, attorney_name, organization, hearing_date)
-                        VALUES (%s,%s,%s,%s,%s)""",
-                     (self.l_case.get(), self.l_status.get(), self.l_att.get(), self.l_org.get(), self.l_date.get()))
+            run_case_tx(self.l_case.get(), [("legal_insert",
+                     (self.l_case.get(), self.l_status.get(), self.l_att.get(), self.l_org.get(), self.l_date.get()))],
+                        ("hearing",))
             messagebox.showinfo("Added", "Legal record added.")
             self.legal_refresh()
         except Exception as e:
@@ -531,6 +899,7 @@ class App(tk.Tk):
         lf.pack(fill="x", pady=6)
 
         self.co_id = tk.StringVar()
+        self.co_version = tk.StringVar()
         self.co_name = tk.StringVar()
         self.co_region = tk.StringVar()
         self.co_migrants = tk.StringVar()
@@ -570,8 +939,7 @@ class App(tk.Tk):
         if not validate_fields(fields):
             return
         try:
-            run_exec("""INSERT INTO CountryOfOrigin (country_name, region, population_migrants, major_language)
-                    VALUES (%s, %s, %s, %s)""",
+            run_exec("country_insert",
                      (self.co_name.get(), self.co_region.get(), int(self.co_migrants.get() or 0), self.co_language.get()))
             messagebox.showinfo("Success", "Country added.")
             self.co_refresh()
@@ -581,14 +949,16 @@ class App(tk.Tk):
             messagebox.showerror("Error", str(e))
 
     def co_refresh(self):
-        rows = run_select("""SELECT country_id, country_name, region, population_migrants, major_language
-                         FROM CountryOfOrigin ORDER BY country_id""")
+        rows = run_select("country_list")
         fill_tree(self.tree_country, rows)
 
-        max_id = run_select("SELECT MAX(country_id) AS max_id FROM CountryOfOrigin")[0]["max_id"] or 0
-        run_exec("ALTER TABLE CountryOfOrigin AUTO_INCREMENT = %s", (max_id + 1,))
+        max_id = run_select("country_max_id")[0]["max_id"] or 0
+        run_exec("country_reset_auto_increment", (max_id + 1,))
 
     def co_update(self):
+        if not self.tree_country.selection():
+            messagebox.showwarning("Select row", "Pick a row first.")
+            return
         fields = {
             "Country Name": self.co_name.get(),
             "Region": self.co_region.get(),
@@ -598,11 +968,14 @@ class App(tk.Tk):
         if not validate_fields(fields):
             return
         try:
-            run_exec("""UPDATE CountryOfOrigin
-                    SET country_name=%s, region=%s, population_migrants=%s, major_language=%s
-                    WHERE country_id=%s""",
+            updated = run_update("country_update",
                      (self.co_name.get(), self.co_region.get(), int(self.co_migrants.get() or 0),
-                      self.co_language.get(), self.co_id.get()))
+                      self.co_language.get(), self.co_id.get(), self.co_version.get()))
+            if not updated:
+                messagebox.showwarning("Conflict", "This country was changed by another user. Reloaded the latest version.")
+                self.co_refresh()
+                self.co_reload_form(self.co_id.get())
+                return
             messagebox.showinfo("Updated", "Country updated.")
             self.co_refresh()
             self._reload_dropdowns()
@@ -619,19 +992,26 @@ class App(tk.Tk):
         country_id = self.tree_country.item(sel[0], "values")[0]
 
         # Check for linked immigrants
-        linked = run_select("SELECT 1 FROM Immigrants WHERE country_id=%s LIMIT 1", (country_id,))
+        linked = run_select("country_has_immigrants", (country_id, country_id))
         if linked:
             messagebox.showerror("Blocked", "Cannot delete: immigrants are linked to this country.")
             return
 
         try:
-            run_exec("DELETE FROM CountryOfOrigin WHERE country_id=%s", (country_id,))
+            run_exec("country_delete", (country_id,))
             messagebox.showinfo("Deleted", "Country deleted.")
             self.co_refresh()
             self._reload_dropdowns()
         except Exception as e:
             messagebox.showerror("Error", str(e))
 
+    def co_reload_form(self, country_id):
+        if select_row(self.tree_country, country_id):
+            self.co_on_select()
+            return
+        for var in (self.co_id, self.co_name, self.co_region, self.co_migrants, self.co_language, self.co_version):
+            var.set("")
+
     def co_on_select(self, _=None):
         sel = self.tree_country.selection()
         if not sel: return
@@ -641,6 +1021,7 @@ class App(tk.Tk):
         self.co_region.set(vals[2])
         self.co_migrants.set(str(vals[3]))
         self.co_language.set(vals[4])
+        self.co_version.set(vals[5])
 
     # ----------------------------------------------------------------
     # 5️⃣ Analytics
@@ -649,11 +1030,15 @@ class App(tk.Tk):
         frm.pack(fill="both", expand=True)
 
         ttk.Label(frm, text="Analytics Queries", font=("Segoe UI", 12, "bold")).pack(pady=5)
+        ttk.Checkbutton(frm, text="Include archived cases", variable=self.include_archive).pack(pady=5)
         ttk.Button(frm, text="(1) Percentage With Lawyers By Custody Type", command=self.q1).pack(pady=5)
         ttk.Button(frm, text="(2) Top 5 Countries By Detention Rate", command=self.q2).pack(pady=5)
         ttk.Button(frm, text="(3) Average Age By Custody Outcome", command=self.q3).pack(pady=5)
         ttk.Button(frm, text="(4) Top 5 Countries With Immigrants That Have Lawyers", command=self.q4).pack(pady=5)
         ttk.Button(frm, text="(5) Percentage Of Immigrants By Arrival Year", command=self.q5).pack(pady=5)
+        ttk.Button(frm, text="(6) Hearing Backlog By Organization (Next 12 Months)", command=self.q6).pack(pady=5)
+        ttk.Button(frm, text="(7) Releases By Custody Type (Last 12 Months)", command=self.q7).pack(pady=5)
+        ttk.Button(frm, text="Query Statistics", command=self.show_query_stats).pack(pady=5)
 
         # Description Box
         self.desc_box = tk.Text(frm, height=4, wrap="word", font=("Segoe UI", 10))
@@ -665,78 +1050,51 @@ class App(tk.Tk):
         self.tree_ana.pack(fill="both", expand=True)
 
     def q1(self):
-        rows = run_select("""
-            SELECT cs.custody_type AS 'Custody Type',
-                   ROUND(SUM(l.representation_status='Has a lawyer')/COUNT(*)*100,1) AS 'Percentage(%) With Lawyer'
-            FROM Immigrants i
-            JOIN CustodyStatus cs ON i.custody_id=cs.custody_id
-            JOIN LegalRepresentation l ON i.legal_id=l.legal_id
-            GROUP BY cs.custody_type
-            ORDER BY 'Percentage With Lawyer' DESC
-        """)
+        rows = run_select(self._archived("q1"))
         fill_tree(self.tree_ana, rows)
         self.update_description("Displaying percentage of immigrants that do have lawyers. "
                                 "Categorized into their Custody Type: Detained, Released, and Never Detained.")
 
     def q2(self):
-        rows = run_select("""
-            SELECT 
-                c.country_name AS 'Country Name',
-                COUNT(*) AS 'Total Immigrants',
-                SUM(cs.custody_type = 'Detained') AS 'Total Detained',
-                ROUND(SUM(cs.custody_type = 'Detained') / COUNT(*) * 100, 1) AS 'Detention Rate'
-            FROM Immigrants i
-            JOIN CountryOfOrigin c ON i.country_id = c.country_id
-            JOIN CustodyStatus cs ON i.custody_id = cs.custody_id
-            GROUP BY c.country_name
-            ORDER BY SUM(cs.custody_type = 'Detained') DESC
-            LIMIT 5;
-        """)
+        rows = run_select(self._archived("q2"))
         fill_tree(self.tree_ana, rows)
         self.update_description("Displaying the top 5 countries that have the highest detention rate.")
 
     def q3(self):
-        rows = run_select("""
-            SELECT cs.custody_outcome AS 'Custody Outcome', ROUND(AVG(i.age),1) AS 'Average Age'
-            FROM Immigrants i
-            JOIN CustodyStatus cs ON i.custody_id=cs.custody_id
-            GROUP BY cs.custody_outcome
-            ORDER BY 'Average Age' DESC
-        """)
+        rows = run_select(self._archived("q3"))
         fill_tree(self.tree_ana, rows)
         self.update_description("Displays the immigrants' custody outcome and the average age per category. "
                                 "The outcome is based on the outcome of the custody.")
 
     def q4(self):
-        rows = run_select("""
-            SELECT 
-                c.country_name AS 'Country Name',
-                COUNT(*) AS 'Total Immigrants',
-                SUM(l.representation_status = 'Has a lawyer') AS 'With Lawyer',
-                ROUND(SUM(l.representation_status = 'Has a lawyer') / COUNT(*) * 100, 1) AS 'Lawyer Rate'
-            FROM Immigrants i
-            JOIN CountryOfOrigin c ON i.country_id = c.country_id
-            JOIN LegalRepresentation l ON i.legal_id = l.legal_id
-            GROUP BY c.country_name
-            ORDER BY `With Lawyer` DESC
-            LIMIT 5;
-        """)
+        rows = run_select(self._archived("q4"))
         fill_tree(self.tree_ana, rows)
         self.update_description("Displaying the top 5 countries with the highest percentage of immigrants who have lawyers.")
 
     def q5(self):
-        rows = run_select("""
-            SELECT 
-                arrival_year AS 'Arrival Year',
-                COUNT(*) AS 'Total Arrivals',
-                ROUND(COUNT(*) / (SELECT COUNT(*) FROM Immigrants) * 100, 1) AS 'Arrival %'
-            FROM Immigrants
-            GROUP BY arrival_year
-            ORDER BY arrival_year;
-        """)
+        rows = run_select(self._archived("q5"))
         fill_tree(self.tree_ana, rows)
         self.update_description("Displaying the percentage of immigrants' arrival by the year.")
 
+    def q6(self):
+        start = month_start(datetime.date.today())
+        rows = run_select("q6", (start, month_start(start, 12)))
+        fill_tree(self.tree_ana, rows)
+        self.update_description("Displaying the number of upcoming hearings per month for each organization over the "
+                                "next 12 months, to plan for hearing backlogs. Includes archived cases.")
+
+    def q7(self):
+        start = month_start(datetime.date.today())
+        rows = run_select("q7", (month_start(start, -12), start))
+        fill_tree(self.tree_ana, rows)
+        self.update_description("Displaying the number of releases per month by custody type over the last 12 months. "
+                                "Includes archived cases.")
+
+    def show_query_stats(self):
+        fill_tree(self.tree_ana, query_stats())
+        self.update_description("Displaying how often each statement has run this session and how long it took, "
+                                "slowest total time first.")
+
     def update_description(self, text):
         self.desc_box.config(state="normal")
         self.desc_box.delete("1.0", "end")
@@ -0,0 +1,54 @@
+"""Moves closed cases out of the working tables into the *_archive tables.
+
+A case is closed when the outcome of its latest custody record is Resolved, Asylum
+Granted or Removed. It is archived once it was released before the cutoff, or has no
+release date and arrived before the cutoff year. Cases whose custody or legal records
+are still used by another working immigrant stay in the working tables:
+
+    python archive_cases.py --years 3 --chunk 500
+
+Each chunk is moved in its own transaction, so the job can be stopped and rerun
+at any time. Archived cases still show up in the app with "Include archived cases".
+"""
+import argparse
+import datetime
+
+from app_tk import run_tx
+
+MOVE_STEPS = (
+    "archive_custody",
+    "archive_legal",
+    "archive_purge_custody",
+    "archive_purge_legal",
+    "archive_purge_immigrants",
+)
+
+
+def archive_closed_cases(cutoff, chunk):
+    totals = {"immigrants": 0, "custody": 0, "legal": 0}
+    while True:
+        counts = run_tx([("archive_immigrants", (cutoff, cutoff.year, chunk))]
+                        + [(name, None) for name in MOVE_STEPS])
+        if not counts[0]:
+            return totals
+        totals["immigrants"] += counts[0]
+        totals["custody"] += counts[1]
+        totals["legal"] += counts[2]
+        print(f"moved {counts[0]} cases ({totals['immigrants']} so far)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--years", type=int, default=3, help="archive cases closed more than this many years ago")
+    parser.add_argument("--chunk", type=int, default=500, help="cases moved per transaction")
+    args = parser.parse_args()
+
+    today = datetime.date.today()
+    cutoff = today.replace(year=today.year - args.years, day=min(today.day, 28))
+    totals = archive_closed_cases(cutoff, args.chunk)
+    print(f"archived {totals['immigrants']} cases, {totals['custody']} custody records and "
+          f"{totals['legal']} legal records closed before {cutoff}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""Multi-threaded contention benchmark for the version-checked writes in app_tk.py.
+
+Runs against the database configured in DB_CFG (same env vars as the app):
+
+    python bench_contention.py --threads 8 --ops 200
+
+Every thread saves the same immigrant the way the Immigrants tab does: the
+version-checked imm_update in a run_case_tx transaction, which takes the case
+lock and updates the rollups, re-reading the row on conflict. Then the threads
+race to create the same case IDs through the app's create transaction
+(case_ids, the immigrant insert and its rollups) to exercise the duplicate-key
+path. The benchmark rows are removed afterwards.
+"""
+import argparse
+import threading
+import time
+
+from app_tk import run_select, run_case_tx, run_tx, is_duplicate
+
+BENCH_CASE = "BENCH-CONTENTION"
+
+
+def create_case(case_id):
+    run_case_tx(case_id, [("case_id_insert", (case_id,)),
+                          ("imm_insert", (case_id, 0, None, None, None, None, 0))])
+
+
+# Benchmark cases have no arrival year, custody or legal records, so they have no rollup buckets to remove
+def cleanup():
+    run_tx([(name, (BENCH_CASE + "%",)) for name in ("bench_imm_cleanup", "bench_case_id_cleanup")])
+
+
+def edit_worker(imm_id, ops, stats, lock):
+    applied = conflicts = 0
+    for i in range(ops):
+        while True:
+            row = run_select("bench_imm_get", (imm_id,))[0]
+            updated = run_case_tx(BENCH_CASE, [("imm_update", (row["age"] + 1, row["gender"], row["arrival_year"],
+                                                               imm_id, row["version"]))], ("arrival",))[0]
+            if updated:
+                applied += 1
+                break
+            conflicts += 1
+    with lock:
+        stats["applied"] += applied
+        stats["conflicts"] += conflicts
+
+
+def create_worker(cases, stats, lock):
+    created = duplicates = 0
+    for case_id in cases:
+        try:
+            create_case(case_id)
+            created += 1
+        except Exception as e:
+            if not is_duplicate(e):
+                raise
+            duplicates += 1
+    with lock:
+        stats["created"] += created
+        stats["duplicates"] += duplicates
+
+
+def run_threads(target, args_per_thread):
+    threads = [threading.Thread(target=target, args=args) for args in args_per_thread]
+    start = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--ops", type=int, default=100, help="operations per thread")
+    args = parser.parse_args()
+
+    lock = threading.Lock()
+    cleanup()
+    create_case(BENCH_CASE)
+    imm_id = run_select("bench_imm_id", (BENCH_CASE,))[0]["immigrant_id"]
+    try:
+        stats = {"applied": 0, "conflicts": 0}
+        elapsed = run_threads(edit_worker, [(imm_id, args.ops, stats, lock)] * args.threads)
+        final_age = run_select("bench_imm_get", (imm_id,))[0]["age"]
+        print(f"updates:  {stats['applied']} applied, {stats['conflicts']} conflicts retried, "
+              f"{stats['applied'] / elapsed:.1f}/s, lost updates: {stats['applied'] - final_age}")
+
+        cases = [f"{BENCH_CASE}-{i}" for i in range(args.ops)]
+        stats = {"created": 0, "duplicates": 0}
+        elapsed = run_threads(create_worker, [(cases, stats, lock)] * args.threads)
+        print(f"creates:  {stats['created']} created, {stats['duplicates']} duplicates rejected, "
+              f"{(stats['created'] + stats['duplicates']) / elapsed:.1f}/s")
+    finally:
+        cleanup()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,321 @@
+# Every SQL statement the application can issue, keyed by name.
+# app_tk.py runs these by name so each one is prepared once per pooled connection.
+import re
+
+# Outcomes after which a case no longer needs to be in the working tables
+CLOSED_OUTCOMES = "('Resolved', 'Asylum Granted', 'Removed')"
+
+QUERIES = {
+    # Dropdowns
+    "country_options": "SELECT country_id, country_name FROM CountryOfOrigin ORDER BY country_name",
+    "custody_options": "SELECT custody_id, custody_type FROM CustodyStatus ORDER BY custody_id",
+    "legal_options": "SELECT legal_id, representation_status FROM LegalRepresentation ORDER BY legal_id",
+
+    # Every case ID in use, working or archived. Its primary key is what rejects a duplicate case.
+    "case_id_insert": "INSERT INTO case_ids (case_id) VALUES (%s)",
+    "case_id_delete": "DELETE FROM case_ids WHERE case_id=%s",
+
+    # Immigrants
+    "imm_list": """
+        SELECT i.immigrant_id, i.case_id, i.age, i.gender,
+               c.country_name, cs.custody_type, l.representation_status, i.arrival_year, i.version
+        FROM Immigrants i
+        LEFT JOIN CountryOfOrigin c ON c.country_id=i.country_id
+        LEFT JOIN CustodyStatus cs ON cs.custody_id=i.custody_id
+        LEFT JOIN LegalRepresentation l ON l.legal_id=i.legal_id
+        ORDER BY i.immigrant_id
+    """,
+    # Ids continue past archived rows too, so a new row never reuses an archived id
+    "imm_max_id": """SELECT GREATEST(COALESCE((SELECT MAX(immigrant_id) FROM Immigrants), 0),
+                                     COALESCE((SELECT MAX(immigrant_id) FROM immigrants_archive), 0)) AS max_id""",
+    "imm_reset_auto_increment": "ALTER TABLE Immigrants AUTO_INCREMENT = %s",
+    "imm_insert": """INSERT INTO Immigrants (case_id, age, gender, country_id, custody_id, legal_id, arrival_year)
+                     VALUES (%s,%s,%s,%s,%s,%s,%s)""",
+    "imm_update": """UPDATE Immigrants
+                     SET age=%s, gender=%s, arrival_year=%s, version=version+1
+                     WHERE immigrant_id=%s AND version=%s""",
+    "imm_delete_by_case": "DELETE FROM Immigrants WHERE case_id=%s",
+    "imm_archive_delete_by_case": "DELETE FROM immigrants_archive WHERE case_id=%s",
+
+    # Custody status
+    "custody_list": "SELECT * FROM CustodyStatus ORDER BY custody_id",
+    "custody_max_id": """SELECT GREATEST(COALESCE((SELECT MAX(custody_id) FROM CustodyStatus), 0),
+                                         COALESCE((SELECT MAX(custody_id) FROM custodystatus_archive), 0)) AS max_id""",
+    "custody_reset_auto_increment": "ALTER TABLE CustodyStatus AUTO_INCREMENT = %s",
+    "custody_insert": """INSERT INTO CustodyStatus (case_id, custody_type, detention_facility, release_date, custody_outcome)
+                         VALUES (%s,%s,%s,%s,%s)""",
+    "custody_delete_by_case": "DELETE FROM CustodyStatus WHERE case_id=%s",
+    "custody_archive_delete_by_case": "DELETE FROM custodystatus_archive WHERE case_id=%s",
+
+    # Legal representation
+    "legal_list": "SELECT * FROM LegalRepresentation ORDER BY legal_id",
+    "legal_max_id": """SELECT GREATEST(COALESCE((SELECT MAX(legal_id) FROM LegalRepresentation), 0),
+                                       COALESCE((SELECT MAX(legal_id) FROM legalrepresentation_archive), 0)) AS max_id""",
+    "legal_reset_auto_increment": "ALTER TABLE LegalRepresentation AUTO_INCREMENT = %s",
+    "legal_insert": """INSERT INTO LegalRepresentation (case_id, representation_status, attorney_name, organization, hearing_date)
+                       VALUES (%s,%s,%s,%s,%s)""",
+    "legal_delete_by_case": "DELETE FROM LegalRepresentation WHERE case_id=%s",
+    "legal_archive_delete_by_case": "DELETE FROM legalrepresentation_archive WHERE case_id=%s",
+
+    # Country of origin
+    "country_list": """SELECT country_id, country_name, region, population_migrants, major_language, version
+                       FROM CountryOfOrigin ORDER BY country_id""",
+    "country_max_id": "SELECT MAX(country_id) AS max_id FROM CountryOfOrigin",
+    "country_reset_auto_increment": "ALTER TABLE CountryOfOrigin AUTO_INCREMENT = %s",
+    "country_insert": """INSERT INTO CountryOfOrigin (country_name, region, population_migrants, major_language)
+                         VALUES (%s, %s, %s, %s)""",
+    "country_update": """UPDATE CountryOfOrigin
+                         SET country_name=%s, region=%s, population_migrants=%s, major_language=%s, version=version+1
+                         WHERE country_id=%s AND version=%s""",
+    "country_has_immigrants": """SELECT 1 FROM Immigrants WHERE country_id=%s
+                                 UNION ALL
+                                 SELECT 1 FROM immigrants_archive WHERE country_id=%s
+                                 LIMIT 1""",
+    "country_delete": "DELETE FROM CountryOfOrigin WHERE country_id=%s",
+
+    # Analytics
+    "q1": """
+        SELECT cs.custody_type AS 'Custody Type',
+               ROUND(SUM(l.representation_status='Has a lawyer')/COUNT(*)*100,1) AS 'Percentage(%) With Lawyer'
+        FROM Immigrants i
+        JOIN CustodyStatus cs ON i.custody_id=cs.custody_id
+        JOIN LegalRepresentation l ON i.legal_id=l.legal_id
+        GROUP BY cs.custody_type
+        ORDER BY 'Percentage With Lawyer' DESC
+    """,
+    "q2": """
+        SELECT
+            c.country_name AS 'Country Name',
+            COUNT(*) AS 'Total Immigrants',
+            SUM(cs.custody_type = 'Detained') AS 'Total Detained',
+            ROUND(SUM(cs.custody_type = 'Detained') / COUNT(*) * 100, 1) AS 'Detention Rate'
+        FROM Immigrants i
+        JOIN CountryOfOrigin c ON i.country_id = c.country_id
+        JOIN CustodyStatus cs ON i.custody_id = cs.custody_id
+        GROUP BY c.country_name
+        ORDER BY SUM(cs.custody_type = 'Detained') DESC
+        LIMIT 5
+    """,
+    "q3": """
+        SELECT cs.custody_outcome AS 'Custody Outcome', ROUND(AVG(i.age),1) AS 'Average Age'
+        FROM Immigrants i
+        JOIN CustodyStatus cs ON i.custody_id=cs.custody_id
+        GROUP BY cs.custody_outcome
+        ORDER BY 'Average Age' DESC
+    """,
+    "q4": """
+        SELECT
+            c.country_name AS 'Country Name',
+            COUNT(*) AS 'Total Immigrants',
+            SUM(l.representation_status = 'Has a lawyer') AS 'With Lawyer',
+            ROUND(SUM(l.representation_status = 'Has a lawyer') / COUNT(*) * 100, 1) AS 'Lawyer Rate'
+        FROM Immigrants i
+        JOIN CountryOfOrigin c ON i.country_id = c.country_id
+        JOIN LegalRepresentation l ON i.legal_id = l.legal_id
+        GROUP BY c.country_name
+        ORDER BY `With Lawyer` DESC
+        LIMIT 5
+    """,
+    "q5": """
+        SELECT
+            arrival_year AS 'Arrival Year',
+            COUNT(*) AS 'Total Arrivals',
+            ROUND(COUNT(*) / (SELECT COUNT(*) FROM Immigrants) * 100, 1) AS 'Arrival %'
+        FROM Immigrants
+        GROUP BY arrival_year
+        ORDER BY arrival_year
+    """,
+
+    # Archival (archive_cases.py). A chunk of closed cases is copied into immigrants_archive first;
+    # the cases that are in both tables are the ones still being moved. A case is judged by its own
+    # latest custody record, the same rows that are then moved with it by case_id. A case stays while
+    # another working immigrant still points at one of its custody or legal rows (the dropdowns reuse
+    # one row per type), so those immigrants keep their values in the working-table lists and analytics.
+    "archive_immigrants": f"""
+        INSERT INTO immigrants_archive
+        SELECT i.* FROM Immigrants i
+        JOIN CustodyStatus cs ON cs.case_id=i.case_id
+        WHERE cs.custody_id=(SELECT MAX(latest.custody_id) FROM CustodyStatus latest WHERE latest.case_id=i.case_id)
+          AND cs.custody_outcome IN {CLOSED_OUTCOMES}
+          AND (cs.release_date < %s OR (cs.release_date IS NULL AND i.arrival_year < %s))
+          AND NOT EXISTS (SELECT 1 FROM CustodyStatus own JOIN Immigrants other ON other.custody_id=own.custody_id
+                          WHERE own.case_id=i.case_id AND other.case_id<>i.case_id)
+          AND NOT EXISTS (SELECT 1 FROM LegalRepresentation own JOIN Immigrants other ON other.legal_id=own.legal_id
+                          WHERE own.case_id=i.case_id AND other.case_id<>i.case_id)
+        ORDER BY i.immigrant_id
+        LIMIT %s
+    """,
+    "archive_custody": """
+        INSERT INTO custodystatus_archive
+        SELECT cs.* FROM CustodyStatus cs
+        JOIN immigrants_archive a ON a.case_id=cs.case_id
+        JOIN Immigrants i ON i.immigrant_id=a.immigrant_id
+    """,
+    "archive_legal": """
+        INSERT INTO legalrepresentation_archive
+        SELECT l.* FROM LegalRepresentation l
+        JOIN immigrants_archive a ON a.case_id=l.case_id
+        JOIN Immigrants i ON i.immigrant_id=a.immigrant_id
+    """,
+    "archive_purge_custody": """
+        DELETE cs FROM CustodyStatus cs
+        JOIN immigrants_archive a ON a.case_id=cs.case_id
+        JOIN Immigrants i ON i.immigrant_id=a.immigrant_id
+    """,
+    "archive_purge_legal": """
+        DELETE l FROM LegalRepresentation l
+        JOIN immigrants_archive a ON a.case_id=l.case_id
+        JOIN Immigrants i ON i.immigrant_id=a.immigrant_id
+    """,
+    "archive_purge_immigrants": """
+        DELETE i FROM Immigrants i
+        JOIN immigrants_archive a ON a.immigrant_id=i.immigrant_id
+    """,
+
+    "q6": """
+        SELECT DATE_FORMAT(bucket_date, '%Y-%m') AS 'Month', organization AS 'Organization', SUM(cnt) AS 'Hearings'
+        FROM case_rollup
+        WHERE metric='hearing' AND grain='month' AND bucket_date >= %s AND bucket_date < %s
+        GROUP BY bucket_date, organization
+        HAVING SUM(cnt) > 0
+        ORDER BY bucket_date, `Hearings` DESC
+    """,
+    "q7": """
+        SELECT DATE_FORMAT(bucket_date, '%Y-%m') AS 'Month', custody_type AS 'Custody Type', SUM(cnt) AS 'Releases'
+        FROM case_rollup
+        WHERE metric='release' AND grain='month' AND bucket_date >= %s AND bucket_date < %s
+        GROUP BY bucket_date, custody_type
+        HAVING SUM(cnt) > 0
+        ORDER BY bucket_date, custody_type
+    """,
+
+    # bench_contention.py
+    "bench_imm_id": "SELECT immigrant_id FROM Immigrants WHERE case_id=%s",
+    "bench_imm_get": "SELECT age, gender, arrival_year, version FROM Immigrants WHERE immigrant_id=%s",
+    "bench_imm_cleanup": "DELETE FROM Immigrants WHERE case_id LIKE %s",
+    "bench_case_id_cleanup": "DELETE FROM case_ids WHERE case_id LIKE %s",
+
+    # Per-case lock around saves (app_tk.run_case_tx)
+    "lock_get": "SELECT GET_LOCK(%s, %s) AS locked",
+    "lock_release": "SELECT RELEASE_LOCK(%s) AS released",
+
+    # Replica health check
+    "replica_status": "SHOW REPLICA STATUS",
+}
+
+# Variants that also read archived cases, through the views that union each table with its archive.
+# The immigrants list is written out so it can show which rows are archived.
+QUERIES["imm_list_all"] = """
+    SELECT i.immigrant_id, i.case_id, i.age, i.gender,
+           c.country_name, cs.custody_type, l.representation_status, i.arrival_year, i.version, i.archived
+    FROM immigrants_all i
+    LEFT JOIN CountryOfOrigin c ON c.country_id=i.country_id
+    LEFT JOIN custodystatus_all cs ON cs.custody_id=i.custody_id
+    LEFT JOIN legalrepresentation_all l ON l.legal_id=i.legal_id
+    ORDER BY i.immigrant_id
+"""
+
+ARCHIVE_VIEWS = {
+    "Immigrants": "immigrants_all",
+    "CustodyStatus": "custodystatus_all",
+    "LegalRepresentation": "legalrepresentation_all",
+}
+
+def with_archive(sql):
+    return re.sub(r"\b(Immigrants|CustodyStatus|LegalRepresentation)\b", lambda m: ARCHIVE_VIEWS[m.group(1)], sql)
+
+for _name in ("custody_list", "legal_list", "q1", "q2", "q3", "q4", "q5"):
+    QUERIES[_name + "_all"] = with_archive(QUERIES[_name])
+
+# Time-bucketed counts in case_rollup. A write to a case reads that case's rows by case_id before and
+# after the change and upserts only the buckets that moved (app_tk.run_case_tx). The rebuild statements
+# recompute every bucket through the _all views so archived cases keep counting.
+ROLLUP_METRICS = ("arrival", "release", "hearing")
+
+# Params: (case_id, case_id). The archive half matters for deleting an archived case.
+QUERIES["rollup_case_immigrant"] = """
+    SELECT country_id, arrival_year FROM Immigrants WHERE case_id=%s
+    UNION ALL
+    SELECT country_id, arrival_year FROM immigrants_archive WHERE case_id=%s
+"""
+QUERIES["rollup_case_custody"] = """
+    SELECT custody_id, custody_type, release_date FROM CustodyStatus WHERE case_id=%s
+    UNION ALL
+    SELECT custody_id, custody_type, release_date FROM custodystatus_archive WHERE case_id=%s
+"""
+QUERIES["rollup_case_legal"] = """
+    SELECT organization, hearing_date FROM LegalRepresentation WHERE case_id=%s
+    UNION ALL
+    SELECT organization, hearing_date FROM legalrepresentation_archive WHERE case_id=%s
+"""
+
+_ROLLUP_INSERT = "INSERT INTO case_rollup (metric, grain, bucket_date, country_id, custody_type, organization, cnt)"
+
+QUERIES["rollup_add"] = _ROLLUP_INSERT + " VALUES (%s,%s,%s,%s,%s,%s,%s) ON DUPLICATE KEY UPDATE cnt=cnt+VALUES(cnt)"
+
+def _month_or_day(col):
+    return f"IF(g.grain='day', {col}, DATE_SUB({col}, INTERVAL DAYOFMONTH({col})-1 DAY))"
+
+# Arrivals take the custody type of the case's own latest custody record
+QUERIES["rollup_arrival_rebuild"] = _ROLLUP_INSERT + """
+    SELECT 'arrival', 'year', MAKEDATE(i.arrival_year, 1), COALESCE(i.country_id, 0),
+           COALESCE(cs.custody_type, ''), '', COUNT(*)
+    FROM immigrants_all i
+    LEFT JOIN (SELECT case_id, MAX(custody_id) AS custody_id FROM custodystatus_all GROUP BY case_id) latest
+           ON latest.case_id=i.case_id
+    LEFT JOIN custodystatus_all cs ON cs.custody_id=latest.custody_id
+    WHERE i.arrival_year BETWEEN 1 AND 9999
+    GROUP BY 1, 2, 3, 4, 5, 6
+"""
+QUERIES["rollup_release_rebuild"] = _ROLLUP_INSERT + f"""
+    SELECT 'release', g.grain, {_month_or_day("cs.release_date")}, COALESCE(i.country_id, 0),
+           COALESCE(cs.custody_type, ''), '', COUNT(*)
+    FROM custodystatus_all cs
+    CROSS JOIN (SELECT 'day' AS grain UNION ALL SELECT 'month') g
+    LEFT JOIN immigrants_all i ON i.case_id=cs.case_id
+    WHERE cs.release_date IS NOT NULL
+    GROUP BY 1, 2, 3, 4, 5, 6
+"""
+QUERIES["rollup_hearing_rebuild"] = _ROLLUP_INSERT + f"""
+    SELECT 'hearing', g.grain, {_month_or_day("l.hearing_date")}, COALESCE(i.country_id, 0),
+           '', COALESCE(l.organization, ''), COUNT(*)
+    FROM legalrepresentation_all l
+    CROSS JOIN (SELECT 'day' AS grain UNION ALL SELECT 'month') g
+    LEFT JOIN immigrants_all i ON i.case_id=l.case_id
+    WHERE l.hearing_date IS NOT NULL
+    GROUP BY 1, 2, 3, 4, 5, 6
+"""
+QUERIES["rollup_clear"] = "DELETE FROM case_rollup"
+
+# Sent as plain text instead of prepared: MySQL rejects a placeholder for AUTO_INCREMENT,
+# and the replica check is a SHOW statement that explain_all() cannot EXPLAIN
+UNPREPARED = {
+    "imm_reset_auto_increment",
+    "custody_reset_auto_increment",
+    "legal_reset_auto_increment",
+    "country_reset_auto_increment",
+    "replica_status",
+}
+
+# Parameters explain_all() binds instead of NULL, where NULL is not valid SQL (LIMIT) or gives a useless plan
+SAMPLE_PARAMS = {
+    "archive_immigrants": ("2020-01-01", 2020, 500),
+    "q6": ("2026-01-01", "2027-01-01"),
+    "q7": ("2025-01-01", "2026-01-01"),
+}
+
+# Read-only list views and analytics that may be answered by a read replica
+REPLICA_READS = {
+    "imm_list",
+    "custody_list",
+    "legal_list",
+    "country_list",
+    "q1",
+    "q2",
+    "q3",
+    "q4",
+    "q5",
+    "q6",
+    "q7",
+}
+REPLICA_READS |= {name + "_all" for name in REPLICA_READS if name + "_all" in QUERIES}
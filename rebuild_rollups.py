@@ -0,0 +1,17 @@
+"""Recomputes the case_rollup time series from the case tables, including archived cases.
+
+The application keeps case_rollup up to date as records are saved. Run this once after
+creating the table on a database that already has data, or after loading data by hand:
+
+    python rebuild_rollups.py
+"""
+from app_tk import rebuild_rollups
+
+
+def main():
+    counts = rebuild_rollups()
+    print(f"rebuilt case_rollup: {counts[1]} arrival, {counts[2]} release and {counts[3]} hearing buckets")
+
+
+if __name__ == "__main__":
+    main()
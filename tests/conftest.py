@@ -0,0 +1,20 @@
+import os
+import sys
+
+# The application modules live at the repository root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+
+# A connection to the database configured for the app; tests that need one are skipped without it
+@pytest.fixture
+def db():
+    mysql = pytest.importorskip("mysql.connector")
+    import app_tk
+    try:
+        cnx = mysql.connect(**app_tk.PRIMARY_CFG, connection_timeout=3)
+    except mysql.Error as e:
+        pytest.skip(f"no database available: {e}")
+    yield cnx
+    cnx.close()
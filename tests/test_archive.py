@@ -0,0 +1,42 @@
+import datetime
+
+import pytest
+
+pytest.importorskip("mysql.connector")
+
+from archive_cases import MOVE_STEPS
+from queries import QUERIES
+
+CASE = "TEST-ARCHIVE-Q1"
+
+
+# Creates a case on the custody and legal rows the app's dropdowns offer, archives, and checks the
+# case keeps its values. Everything runs in one transaction that is rolled back.
+def test_archiving_keeps_rows_used_by_working_cases(db):
+    cur = db.cursor(dictionary=True, buffered=True)
+
+    def run(name, params=None):
+        cur.execute(QUERIES[name], params)
+        return cur.fetchall() if cur.with_rows else cur.rowcount
+
+    db.start_transaction()
+    try:
+        # Same lookups as App._reload_dropdowns: the last row of each type wins
+        custody = {r["custody_type"]: r["custody_id"] for r in run("custody_options")}
+        legal = {r["representation_status"]: r["legal_id"] for r in run("legal_options")}
+        custody_type, custody_id = next(iter(custody.items()))
+        legal_status, legal_id = next(iter(legal.items()))
+        run("case_id_insert", (CASE,))
+        run("imm_insert", (CASE, 30, "Female", None, custody_id, legal_id, datetime.date.today().year))
+
+        today = datetime.date.today()
+        cutoff = today.replace(year=today.year - 3, day=min(today.day, 28))
+        run("archive_immigrants", (cutoff, cutoff.year, 1000000))
+        for name in MOVE_STEPS:
+            run(name)
+
+        row = next(r for r in run("imm_list") if r["case_id"] == CASE)
+        assert (row["custody_type"], row["representation_status"]) == (custody_type, legal_status)
+        assert custody_type in {r["Custody Type"] for r in run("q1")}
+    finally:
+        db.rollback()
@@ -0,0 +1,24 @@
+import pytest
+
+mysql = pytest.importorskip("mysql.connector")
+
+import app_tk
+from queries import QUERIES, UNPREPARED, SAMPLE_PARAMS
+
+
+def test_sample_params_match_placeholders():
+    for name, params in SAMPLE_PARAMS.items():
+        assert len(params) == QUERIES[name].count("%s"), name
+
+
+def test_unprepared_names_are_registered():
+    assert UNPREPARED <= QUERIES.keys()
+
+
+def test_every_statement_explains(db):
+    plans, errors = app_tk.explain_all()
+    assert errors == {}
+    explainable = {name for name in QUERIES if name not in UNPREPARED}
+    assert plans.keys() == explainable
+    for name, plan in plans.items():
+        assert plan, name
@@ -0,0 +1,85 @@
+import itertools
+import time
+
+import pytest
+
+mysql = pytest.importorskip("mysql.connector")
+
+import app_tk
+
+
+@pytest.fixture
+def replicas(monkeypatch):
+    pair = [app_tk.Replica({"host": f"replica{n}", "port": 3306}, 1) for n in (1, 2)]
+    for replica in pair:
+        replica.lag_ok = lambda: True
+    monkeypatch.setattr(app_tk, "REPLICAS", pair)
+    monkeypatch.setattr(app_tk, "_replica_cycle", itertools.cycle(pair))
+    monkeypatch.setattr(app_tk, "_last_write", float("-inf"))
+    return pair
+
+
+def test_reads_rotate_over_healthy_replicas(replicas):
+    assert [app_tk.pick_replica("imm_list") for _ in range(4)] == replicas * 2
+    replicas[0].lag_ok = lambda: False
+    replicas[0].checked_at = None
+    assert [app_tk.pick_replica("imm_list") for _ in range(3)] == [replicas[1]] * 3
+
+
+def test_writes_and_unlisted_reads_use_the_primary(replicas):
+    assert app_tk.pick_replica("imm_max_id") is None
+    app_tk._last_write = time.monotonic()
+    assert app_tk.pick_replica("imm_list") is None
+    app_tk._last_write = time.monotonic() - app_tk.READ_YOUR_WRITES_SECONDS - 1
+    assert app_tk.pick_replica("imm_list") in replicas
+
+
+def test_no_replica_when_all_are_down(replicas):
+    for replica in replicas:
+        replica.lag_ok = lambda: False
+    assert app_tk.pick_replica("imm_list") is None
+
+
+def test_down_replica_backs_off_until_the_cap(replicas):
+    replica = replicas[0]
+    probes = []
+    replica.lag_ok = lambda: probes.append(1) or False
+    delays = []
+    for _ in range(8):
+        replica.checked_at = None
+        assert not replica.usable()
+        delays.append(replica.retry_after)
+    assert delays == [10, 20, 40, 80, 160, 300, 300, 300]
+
+    # Within the delay the cached result is used without probing again
+    assert not replica.usable()
+    assert len(probes) == 8
+
+
+def test_healthy_replica_that_fails_is_retried_soon(replicas):
+    replica = replicas[0]
+    assert replica.usable()
+    replica.mark_down()
+    assert not replica.healthy
+    assert replica.retry_after == app_tk.LAG_CHECK_SECONDS
+
+
+@pytest.mark.parametrize("error", [mysql.errors.ConnectionTimeoutError, mysql.OperationalError])
+def test_failed_replica_read_falls_back_to_the_primary(replicas, monkeypatch, error):
+    pools = []
+
+    def execute(pool, name, params=None, fetch=False):
+        pools.append(pool)
+        if pool is not app_tk.PRIMARY:
+            raise error("replica unreachable")
+        return [{"from": "primary"}]
+
+    monkeypatch.setattr(app_tk, "_execute", execute)
+    assert app_tk.run_select("imm_list") == [{"from": "primary"}]
+    assert pools == [replicas[0].pool, app_tk.PRIMARY]
+    assert not replicas[0].healthy
+
+    # The next read goes to the other replica
+    pools.clear()
+    app_tk.run_select("imm_list")
+    assert pools[0] is replicas[1].pool
@@ -0,0 +1,92 @@
+import datetime
+import threading
+import time
+
+import pytest
+
+pytest.importorskip("mysql.connector")
+
+import app_tk
+from app_tk import rollup_buckets
+
+IMMIGRANT = [{"country_id": 3, "arrival_year": 2020}]
+CUSTODY = [
+    {"custody_id": 4, "custody_type": "Detained", "release_date": datetime.date(2024, 5, 6)},
+    {"custody_id": 9, "custody_type": "Released", "release_date": None},
+]
+LEGAL = [{"organization": "RAICES", "hearing_date": datetime.date(2025, 2, 14)}]
+
+
+def test_buckets_for_each_metric():
+    assert rollup_buckets(IMMIGRANT, CUSTODY, LEGAL) == {
+        ("arrival", "year", datetime.date(2020, 1, 1), 3, "Released", ""): 1,
+        ("release", "day", datetime.date(2024, 5, 6), 3, "Detained", ""): 1,
+        ("release", "month", datetime.date(2024, 5, 1), 3, "Detained", ""): 1,
+        ("hearing", "day", datetime.date(2025, 2, 14), 3, "", "RAICES"): 1,
+        ("hearing", "month", datetime.date(2025, 2, 1), 3, "", "RAICES"): 1,
+    }
+
+
+def test_buckets_without_immigrant_or_custody():
+    assert rollup_buckets([], [], LEGAL, ("arrival", "hearing")) == {
+        ("hearing", "day", datetime.date(2025, 2, 14), 0, "", "RAICES"): 1,
+        ("hearing", "month", datetime.date(2025, 2, 1), 0, "", "RAICES"): 1,
+    }
+    assert rollup_buckets([{"country_id": None, "arrival_year": 2019}], [], [], ("arrival",)) == {
+        ("arrival", "year", datetime.date(2019, 1, 1), 0, "", ""): 1,
+    }
+
+
+def test_arrival_years_outside_date_range_are_skipped():
+    for year in (0, -5, 10000, None):
+        assert rollup_buckets([{"country_id": 3, "arrival_year": year}], CUSTODY, [], ("arrival",)) == {}
+
+
+RACE_CASE = "TEST-ROLLUP-RACE"
+RACE_BUCKETS = """SELECT metric, grain, bucket_date, country_id, custody_type, organization, cnt
+                  FROM case_rollup WHERE bucket_date < '1902-01-01' AND cnt <> 0"""
+
+
+def rollup_rows(db):
+    cur = db.cursor()
+    cur.execute(RACE_BUCKETS)
+    return {row[:-1]: row[-1] for row in cur.fetchall()}
+
+
+# One clerk changes the arrival year while another adds a custody record to the same case. The custody
+# save is started after the first save has read its "before" buckets and must not land in between.
+def test_concurrent_saves_to_one_case(db, monkeypatch):
+    db.autocommit = True
+    assert rollup_rows(db) == {}
+    app_tk.run_case_tx(RACE_CASE, [("case_id_insert", (RACE_CASE,)),
+                                   ("imm_insert", (RACE_CASE, 30, "Female", None, None, None, 1900))])
+    try:
+        cur = db.cursor(dictionary=True)
+        cur.execute("SELECT immigrant_id, version FROM Immigrants WHERE case_id=%s", (RACE_CASE,))
+        imm = cur.fetchone()
+
+        other = threading.Thread(target=app_tk.run_case_tx, args=(RACE_CASE, [("custody_insert", (
+            RACE_CASE, "Detained", "", datetime.date(1901, 6, 1), "Pending"))], ("arrival", "release")))
+        case_buckets = app_tk._case_buckets
+
+        def start_other_save_once(conn, case_id, metrics):
+            if other.ident is None:
+                other.start()
+                time.sleep(0.5)
+            return case_buckets(conn, case_id, metrics)
+
+        monkeypatch.setattr(app_tk, "_case_buckets", start_other_save_once)
+        app_tk.run_case_tx(RACE_CASE, [("imm_update", (30, "Female", 1901, imm["immigrant_id"], imm["version"]))],
+                           ("arrival",))
+        other.join()
+        monkeypatch.undo()
+
+        assert rollup_rows(db) == {
+            ("arrival", "year", datetime.date(1901, 1, 1), 0, "Detained", ""): 1,
+            ("release", "day", datetime.date(1901, 6, 1), 0, "Detained", ""): 1,
+            ("release", "month", datetime.date(1901, 6, 1), 0, "Detained", ""): 1,
+        }
+    finally:
+        app_tk.run_case_tx(RACE_CASE, [(name, (RACE_CASE,)) for name in (
+            "custody_delete_by_case", "imm_delete_by_case", "case_id_delete")])
+    assert rollup_rows(db) == {}